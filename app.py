@@ -1,12 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import yfinance as yf
-from utils.data_fetcher import DataFetcher
-from utils.ai_predictor import AIPredictor
-from utils.chart_creator import ChartCreator
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Heavy modules (yfinance, plotly, the utils built on them) are imported
+# lazily inside the factories and analysis functions so first paint does not
+# pay their import cost
 
 # Page configuration
 st.set_page_config(
@@ -16,13 +14,22 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state
-if 'data_fetcher' not in st.session_state:
-    st.session_state.data_fetcher = DataFetcher()
-if 'ai_predictor' not in st.session_state:
-    st.session_state.ai_predictor = AIPredictor()
-if 'chart_creator' not in st.session_state:
-    st.session_state.chart_creator = ChartCreator()
+# Shared utility singletons; cache_resource builds one instance per process
+# instead of one per user session
+@st.cache_resource
+def _data_fetcher():
+    from utils.data_fetcher import DataFetcher
+    return DataFetcher()
+
+@st.cache_resource
+def _ai_predictor():
+    from utils.ai_predictor import AIPredictor
+    return AIPredictor()
+
+@st.cache_resource
+def _chart_creator():
+    from utils.chart_creator import ChartCreator
+    return ChartCreator()
 
 def main():
     st.title("📈 Financial Analysis Platform")
@@ -42,40 +49,48 @@ def main():
     elif page == "Mutual Fund Analysis":
         show_mutual_fund_analysis()
 
+@st.cache_data(ttl=600)
+def _dashboard_recommendations():
+    """Run the stock and fund universe scans once, each side in parallel.
+
+    Each scan scores BUY and SELL from the same fetched data, so the
+    dashboard hits yfinance once per symbol instead of twice.
+    """
+    predictor = _ai_predictor()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stock_future = executor.submit(predictor.get_top_stock_recommendations_both)
+        mf_future = executor.submit(predictor.get_top_mf_recommendations_both)
+        return stock_future.result(), mf_future.result()
+
 def show_dashboard():
     st.header("🎯 Market Dashboard")
-    
+
     # Create tabs for different recommendation types
     tab1, tab2, tab3, tab4 = st.tabs([
-        "📈 Top Stock Buys", 
-        "📉 Top Stock Sells", 
-        "🏦 Top MF Buys", 
+        "📈 Top Stock Buys",
+        "📉 Top Stock Sells",
+        "🏦 Top MF Buys",
         "🏦 Top MF Sells"
     ])
-    
+
+    with st.spinner("Generating AI-powered recommendations..."):
+        stock_recs, mf_recs = _dashboard_recommendations()
+
     with tab1:
         st.subheader("Top 5 Stock Buy Recommendations")
-        with st.spinner("Generating AI-powered stock recommendations..."):
-            stock_buys = st.session_state.ai_predictor.get_top_stock_recommendations("BUY")
-            display_recommendations(stock_buys, "stock")
-    
+        display_recommendations(stock_recs["BUY"], "stock")
+
     with tab2:
         st.subheader("Top 5 Stock Sell Recommendations")
-        with st.spinner("Analyzing market conditions for sell opportunities..."):
-            stock_sells = st.session_state.ai_predictor.get_top_stock_recommendations("SELL")
-            display_recommendations(stock_sells, "stock")
-    
+        display_recommendations(stock_recs["SELL"], "stock")
+
     with tab3:
         st.subheader("Top 5 Mutual Fund Buy Recommendations")
-        with st.spinner("Evaluating mutual fund opportunities..."):
-            mf_buys = st.session_state.ai_predictor.get_top_mf_recommendations("BUY")
-            display_recommendations(mf_buys, "mutual_fund")
-    
+        display_recommendations(mf_recs["BUY"], "mutual_fund")
+
     with tab4:
         st.subheader("Top 5 Mutual Fund Sell Recommendations")
-        with st.spinner("Analyzing mutual fund exit strategies..."):
-            mf_sells = st.session_state.ai_predictor.get_top_mf_recommendations("SELL")
-            display_recommendations(mf_sells, "mutual_fund")
+        display_recommendations(mf_recs["SELL"], "mutual_fund")
 
 def display_recommendations(recommendations, asset_type):
     if not recommendations:
@@ -110,45 +125,63 @@ def display_recommendations(recommendations, asset_type):
 
 def show_stock_analysis():
     st.header("📊 Stock Analysis")
-    
-    # Stock symbol input
-    symbol = st.text_input("Enter Stock Symbol (e.g., RELIANCE.NS, TCS.NS, HDFCBANK.NS)", value="RELIANCE.NS").upper()
-    
-    if symbol:
-        # Time period selection
+
+    # Batch the inputs in a form so the page reruns once per submit
+    # instead of on every keystroke
+    with st.form("stock_analysis_form"):
+        symbol = st.text_input("Enter Stock Symbol (e.g., RELIANCE.NS, TCS.NS, HDFCBANK.NS)", value="RELIANCE.NS").upper()
         period = st.selectbox("Analysis Period", ["1y", "2y", "3y", "5y"], index=0)
-        
-        if st.button("Analyze Stock", type="primary"):
-            analyze_individual_stock(symbol, period)
+        submitted = st.form_submit_button("Analyze Stock", type="primary")
+
+    if submitted and symbol:
+        analyze_individual_stock(symbol, period)
 
 def show_mutual_fund_analysis():
     st.header("🏦 Mutual Fund Analysis")
-    
-    # Mutual fund symbol input
-    symbol = st.text_input("Enter Mutual Fund Symbol (e.g., VTSAX, FXNAX, SWPPX)", value="VTSAX").upper()
-    
-    if symbol:
-        # Time period selection
+
+    # Batch the inputs in a form so the page reruns once per submit
+    # instead of on every keystroke
+    with st.form("mutual_fund_analysis_form"):
+        symbol = st.text_input("Enter Mutual Fund Symbol (e.g., VTSAX, FXNAX, SWPPX)", value="VTSAX").upper()
         period = st.selectbox("Analysis Period", ["1y", "2y", "3y", "5y"], index=0)
-        
-        if st.button("Analyze Mutual Fund", type="primary"):
-            analyze_individual_mutual_fund(symbol, period)
+        submitted = st.form_submit_button("Analyze Mutual Fund", type="primary")
+
+    if submitted and symbol:
+        analyze_individual_mutual_fund(symbol, period)
 
 def analyze_individual_stock(symbol, period):
+    from utils import cached_data
+
+    # Repeat clicks with the same inputs reuse the last pipeline results
+    # instead of re-fetching and re-analyzing
+    cache = st.session_state.setdefault('last_stock_analysis', {})
+    key = (symbol, period)
+
     try:
-        with st.spinner(f"Fetching data for {symbol}..."):
-            # Get stock data
-            stock_data = st.session_state.data_fetcher.get_stock_data(symbol, period)
-            if stock_data is None:
-                st.error(f"Could not fetch data for {symbol}. Please check the symbol and try again.")
-                return
-            
-            # Get company info
-            company_info = st.session_state.data_fetcher.get_company_info(symbol)
-            
-            # Get news sentiment
-            news_sentiment = st.session_state.data_fetcher.get_news_sentiment(symbol)
-            
+        if key in cache:
+            stock_data, company_info, news_sentiment, analysis = cache[key]
+        else:
+            with st.spinner(f"Fetching data for {symbol}..."):
+                # Get stock data
+                stock_data = cached_data.get_stock_data(symbol, period)
+                if stock_data is None:
+                    st.error(f"Could not fetch data for {symbol}. Please check the symbol and try again.")
+                    return
+
+                # Get company info
+                company_info = cached_data.get_company_info(symbol)
+
+                # Get news sentiment
+                news_sentiment = cached_data.get_news_sentiment(symbol)
+
+            # AI Analysis
+            with st.spinner("Generating AI-powered analysis..."):
+                analysis = _ai_predictor().analyze_stock(symbol, stock_data, news_sentiment, company_info)
+
+            cache.clear()  # keep only the most recent analysis
+            cache[key] = (stock_data, company_info, news_sentiment, analysis)
+
+
         # Display company information
         if company_info:
             col1, col2, col3 = st.columns(3)
@@ -159,18 +192,15 @@ def analyze_individual_stock(symbol, period):
                 st.metric("Market Cap", f"₹{company_info.get('marketCap', 0):,.0f}")
                 st.metric("P/E Ratio", f"{company_info.get('trailingPE', 0):.2f}")
             with col3:
-                current_price = stock_data['Close'].iloc[-1]
-                price_change = ((current_price - stock_data['Close'].iloc[-2]) / stock_data['Close'].iloc[-2]) * 100
+                closes = stock_data['Close'].to_numpy()
+                current_price, prev_price = closes[-1], closes[-2]
+                price_change = (current_price / prev_price - 1) * 100
                 st.metric("Current Price", f"₹{current_price:.2f}", f"{price_change:+.2f}%")
         
         # Create and display charts
-        fig = st.session_state.chart_creator.create_stock_chart(stock_data, symbol)
+        fig = _chart_creator().create_stock_chart(stock_data, symbol)
         st.plotly_chart(fig, use_container_width=True)
-        
-        # AI Analysis
-        with st.spinner("Generating AI-powered analysis..."):
-            analysis = st.session_state.ai_predictor.analyze_stock(symbol, stock_data, news_sentiment, company_info)
-        
+
         # Display AI analysis results
         col1, col2 = st.columns(2)
         
@@ -206,7 +236,7 @@ def analyze_individual_stock(symbol, period):
         
         # Technical indicators
         st.subheader("📊 Technical Analysis")
-        technical_data = st.session_state.data_fetcher.calculate_technical_indicators(stock_data)
+        technical_data = cached_data.calculate_technical_indicators(symbol, period)
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -222,17 +252,35 @@ def analyze_individual_stock(symbol, period):
         st.error(f"An error occurred while analyzing {symbol}: {str(e)}")
 
 def analyze_individual_mutual_fund(symbol, period):
+    from utils import cached_data
+
+    # Repeat clicks with the same inputs reuse the last pipeline results
+    # instead of re-fetching and re-analyzing
+    cache = st.session_state.setdefault('last_fund_analysis', {})
+    key = (symbol, period)
+
     try:
-        with st.spinner(f"Fetching data for {symbol}..."):
-            # Get mutual fund data
-            fund_data = st.session_state.data_fetcher.get_mutual_fund_data(symbol, period)
-            if fund_data is None:
-                st.error(f"Could not fetch data for {symbol}. Please check the symbol and try again.")
-                return
-            
-            # Get fund info
-            fund_info = st.session_state.data_fetcher.get_fund_info(symbol)
-            
+        if key in cache:
+            fund_data, fund_info, analysis = cache[key]
+        else:
+            with st.spinner(f"Fetching data for {symbol}..."):
+                # Get mutual fund data
+                fund_data = cached_data.get_mutual_fund_data(symbol, period)
+                if fund_data is None:
+                    st.error(f"Could not fetch data for {symbol}. Please check the symbol and try again.")
+                    return
+
+                # Get fund info
+                fund_info = cached_data.get_fund_info(symbol)
+
+            # AI Analysis for mutual fund
+            with st.spinner("Generating AI-powered mutual fund analysis..."):
+                analysis = _ai_predictor().analyze_mutual_fund(symbol, fund_data, fund_info)
+
+            cache.clear()  # keep only the most recent analysis
+            cache[key] = (fund_data, fund_info, analysis)
+
+    
         # Display fund information
         if fund_info:
             col1, col2, col3 = st.columns(3)
@@ -243,18 +291,15 @@ def analyze_individual_mutual_fund(symbol, period):
                 st.metric("Net Assets", f"₹{fund_info.get('totalAssets', 0):,.0f}")
                 st.metric("Expense Ratio", f"{fund_info.get('annualReportExpenseRatio', 0)*100:.2f}%")
             with col3:
-                current_price = fund_data['Close'].iloc[-1]
-                price_change = ((current_price - fund_data['Close'].iloc[-2]) / fund_data['Close'].iloc[-2]) * 100
+                navs = fund_data['Close'].to_numpy()
+                current_price, prev_price = navs[-1], navs[-2]
+                price_change = (current_price / prev_price - 1) * 100
                 st.metric("Current NAV", f"₹{current_price:.2f}", f"{price_change:+.2f}%")
         
         # Create and display charts
-        fig = st.session_state.chart_creator.create_mutual_fund_chart(fund_data, symbol)
+        fig = _chart_creator().create_mutual_fund_chart(fund_data, symbol)
         st.plotly_chart(fig, use_container_width=True)
-        
-        # AI Analysis for mutual fund
-        with st.spinner("Generating AI-powered mutual fund analysis..."):
-            analysis = st.session_state.ai_predictor.analyze_mutual_fund(symbol, fund_data, fund_info)
-        
+
         # Display AI analysis results
         col1, col2 = st.columns(2)
         
@@ -269,7 +314,7 @@ def analyze_individual_mutual_fund(symbol, period):
         
         with col2:
             st.subheader("📊 Performance Metrics")
-            performance = st.session_state.data_fetcher.calculate_fund_performance(fund_data)
+            performance = cached_data.calculate_fund_performance(symbol, period)
             st.markdown(f"**1Y Return**: {performance['1y_return']:.2f}%")
             st.markdown(f"**Sharpe Ratio**: {performance['sharpe_ratio']:.2f}")
             st.markdown(f"**Max Drawdown**: {performance['max_drawdown']:.2f}%")
@@ -4,6 +4,22 @@ import pandas as pd
 from utils.data_fetcher import DataFetcher
 from utils.ai_predictor import AIPredictor
 from utils.chart_creator import ChartCreator
+from utils import cached_data
+from utils.fund_stats import fund_stats, rolling_return_stats
+
+@st.cache_data
+def _investment_considerations(expense_ratio, sharpe_ratio, max_drawdown, volatility):
+    """Build the considerations bullet list from scalar metrics.
+
+    Pure function of four floats, so Streamlit can memoize the string
+    assembly across reruns of the same analysis.
+    """
+    return [
+        f"Expense ratio of {(expense_ratio or 0)*100:.2f}% {'is competitive' if expense_ratio is not None and expense_ratio < 0.01 else 'should be compared with peers'}",
+        f"Fund has {'excellent' if sharpe_ratio > 1.5 else 'good' if sharpe_ratio > 1.0 else 'moderate'} risk-adjusted returns",
+        f"Maximum drawdown of {max_drawdown:.1f}% indicates {'low' if abs(max_drawdown) < 10 else 'moderate' if abs(max_drawdown) < 20 else 'high'} downside risk",
+        f"Suitable for {'conservative' if volatility < 10 else 'moderate' if volatility < 20 else 'aggressive'} investors based on volatility"
+    ]
 
 def show_mutual_fund_analysis():
     st.title("🏦 Individual Mutual Fund Analysis")
@@ -16,23 +32,28 @@ def show_mutual_fund_analysis():
     if 'chart_creator' not in st.session_state:
         st.session_state.chart_creator = ChartCreator()
     
-    # Fund input section
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        symbol = st.text_input(
-            "Enter Mutual Fund Symbol", 
-            value="SBI-BLUECHIP",
-            placeholder="e.g., SBI-BLUECHIP, HDFC-TOP100, ICICI-BLUECHIP"
-        ).upper()
-    
-    with col2:
-        period = st.selectbox(
-            "Analysis Period",
-            ["1y", "2y", "3y", "5y"],
-            index=0
-        )
-    
+    # Fund input section; the form batches the inputs so the page reruns
+    # once per submit instead of on every keystroke
+    with st.form("mutual_fund_analysis_form"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            symbol = st.text_input(
+                "Enter Mutual Fund Symbol",
+                value="SBI-BLUECHIP",
+                placeholder="e.g., SBI-BLUECHIP, HDFC-TOP100, ICICI-BLUECHIP"
+            ).upper()
+
+        with col2:
+            period = st.selectbox(
+                "Analysis Period",
+                ["1y", "2y", "3y", "5y"],
+                index=0
+            )
+
+        submitted = st.form_submit_button("🔍 Analyze Mutual Fund", type="primary")
+
+
     # Popular Indian funds suggestions
     st.write("**Popular Indian Mutual Funds:**")
     popular_funds = [
@@ -53,8 +74,8 @@ def show_mutual_fund_analysis():
     # Use selected fund if available
     if 'selected_fund' in st.session_state:
         symbol = st.session_state.selected_fund
-    
-    if symbol and st.button("🔍 Analyze Mutual Fund", type="primary"):
+
+    if submitted and symbol:
         analyze_mutual_fund_detailed(symbol, period)
 
 def analyze_mutual_fund_detailed(symbol, period):
@@ -69,8 +90,8 @@ def analyze_mutual_fund_detailed(symbol, period):
         status_text.text("Fetching mutual fund data...")
         progress_bar.progress(25)
         
-        fund_data = st.session_state.data_fetcher.get_mutual_fund_data(symbol, period)
-        if fund_data is None or fund_data.empty:
+        fund_data = cached_data.get_mutual_fund_data(symbol, period)
+        if fund_data is None or len(fund_data) == 0:
             st.error(f"❌ Could not fetch data for {symbol}. Please check the symbol and try again.")
             return
         
@@ -78,13 +99,13 @@ def analyze_mutual_fund_detailed(symbol, period):
         status_text.text("Getting fund information...")
         progress_bar.progress(50)
         
-        fund_info = st.session_state.data_fetcher.get_fund_info(symbol)
+        fund_info = cached_data.get_fund_info(symbol)
         
         # Step 3: Calculate performance metrics
         status_text.text("Calculating performance metrics...")
         progress_bar.progress(75)
         
-        performance_metrics = st.session_state.data_fetcher.calculate_fund_performance(fund_data)
+        performance_metrics = cached_data.calculate_fund_performance(symbol, period)
         
         # Step 4: Generate AI analysis
         status_text.text("Generating AI-powered analysis...")
@@ -110,15 +131,20 @@ def analyze_mutual_fund_detailed(symbol, period):
 
 def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, performance_metrics):
     """Display comprehensive mutual fund analysis results"""
-    
+
+    # Materialize the close series once; all later indexing is raw ndarray
+    closes = fund_data['Close'].to_numpy(dtype=np.float64, copy=True)
+
     # Header with fund info
     if fund_info:
         col1, col2, col3 = st.columns(3)
         
         with col1:
+            fund_name = fund_info.get('longName', symbol)
+            display_name = fund_name[:30] + "..." if len(fund_name) > 30 else fund_name
             st.metric(
-                "Fund Name", 
-                fund_info.get('longName', symbol)[:30] + "..." if len(fund_info.get('longName', symbol)) > 30 else fund_info.get('longName', symbol),
+                "Fund Name",
+                display_name,
                 help="Full fund name"
             )
             st.metric(
@@ -153,9 +179,9 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
                 st.metric("Expense Ratio", "N/A")
         
         with col3:
-            current_nav = fund_data['Close'].iloc[-1]
-            prev_nav = fund_data['Close'].iloc[-2] if len(fund_data) > 1 else current_nav
-            nav_change = ((current_nav - prev_nav) / prev_nav) * 100
+            current_nav = closes[-1]
+            prev_nav = closes[-2] if len(closes) > 1 else current_nav
+            nav_change = (current_nav / prev_nav - 1) * 100
             
             st.metric(
                 "Current NAV", 
@@ -176,7 +202,12 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
                 st.metric("Inception Year", "N/A")
     
     st.divider()
-    
+
+    # One fused pass over the close series for all daily-return statistics
+    # shared by the tabs below
+    (annual_return, annual_vol, downside_deviation,
+     fund_sharpe, fund_sortino) = fund_stats(closes)
+
     # Main analysis tabs
     tab1, tab2, tab3, tab4 = st.tabs([
         "📊 Performance Chart", 
@@ -207,9 +238,8 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
             st.metric("Max Drawdown", f"{max_drawdown:.2f}%")
         
         with col4:
-            volatility = fund_data['Close'].pct_change().std() * np.sqrt(252) * 100
-            vol_level = "High" if volatility > 20 else "Medium" if volatility > 10 else "Low"
-            st.metric("Volatility", f"{volatility:.2f}%", vol_level)
+            vol_level = "High" if annual_vol > 20 else "Medium" if annual_vol > 10 else "Low"
+            st.metric("Volatility", f"{annual_vol:.2f}%", vol_level)
     
     with tab2:
         st.subheader("🤖 AI-Powered Fund Analysis")
@@ -280,78 +310,65 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
     
     with tab3:
         st.subheader("📈 Detailed Performance Metrics")
-        
-        # Risk-return analysis
-        returns = fund_data['Close'].pct_change().dropna()
-        
+
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Return Analysis")
             
-            # Calculate different period returns
-            periods = {
-                "1 Month": 21,
-                "3 Months": 63,
-                "6 Months": 126,
-                "1 Year": 252
-            }
-            
-            return_data = []
-            for period_name, days in periods.items():
-                if len(fund_data) >= days:
-                    period_return = ((fund_data['Close'].iloc[-1] / fund_data['Close'].iloc[-days]) - 1) * 100
-                    return_data.append({"Period": period_name, "Return (%)": f"{period_return:.2f}%"})
+            # Calculate different period returns in one vectorized gather
+            period_names = ["1 Month", "3 Months", "6 Months", "1 Year"]
+            period_days = np.array([21, 63, 126, 252])
+
+            valid = period_days <= len(closes)
+            period_returns = (closes[-1] / closes[-period_days[valid]] - 1) * 100
+
+            return_data = [
+                {"Period": name, "Return (%)": f"{ret:.2f}%"}
+                for name, ret in zip(np.array(period_names)[valid], period_returns)
+            ]
             
             if return_data:
-                returns_df = pd.DataFrame(return_data)
-                st.dataframe(returns_df, use_container_width=True, hide_index=True)
+                # st.table renders the small list-of-dicts directly, without
+                # a DataFrame + Arrow serialization round-trip
+                st.table(return_data)
         
         with col2:
             st.subheader("Risk Metrics")
-            
-            # Calculate risk metrics
-            annual_return = returns.mean() * 252 * 100
-            annual_vol = returns.std() * np.sqrt(252) * 100
-            sharpe_ratio = (annual_return - 2) / annual_vol if annual_vol > 0 else 0  # Assuming 2% risk-free rate
-            
-            # Downside deviation
-            downside_returns = returns[returns < 0]
-            downside_deviation = downside_returns.std() * np.sqrt(252) * 100 if len(downside_returns) > 0 else 0
-            
-            # Sortino ratio
-            sortino_ratio = (annual_return - 2) / downside_deviation if downside_deviation > 0 else 0
-            
+
+            # All values come from the fused fund_stats pass above
             risk_data = [
                 {"Metric": "Annual Return", "Value": f"{annual_return:.2f}%"},
                 {"Metric": "Annual Volatility", "Value": f"{annual_vol:.2f}%"},
-                {"Metric": "Sharpe Ratio", "Value": f"{sharpe_ratio:.2f}"},
-                {"Metric": "Sortino Ratio", "Value": f"{sortino_ratio:.2f}"},
+                {"Metric": "Sharpe Ratio", "Value": f"{fund_sharpe:.2f}"},
+                {"Metric": "Sortino Ratio", "Value": f"{fund_sortino:.2f}"},
                 {"Metric": "Downside Deviation", "Value": f"{downside_deviation:.2f}%"}
             ]
             
-            risk_df = pd.DataFrame(risk_data)
-            st.dataframe(risk_df, use_container_width=True, hide_index=True)
+            st.table(risk_data)
         
         # Rolling returns analysis
         st.subheader("Rolling Returns Analysis")
         
         if len(fund_data) >= 252:  # At least 1 year of data
-            rolling_periods = [30, 90, 252]  # 1M, 3M, 1Y
-            
-            for period in rolling_periods:
-                if len(fund_data) >= period:
-                    rolling_returns = fund_data['Close'].pct_change(period).rolling(window=period).mean() * 100
-                    
-                    period_name = f"{period//21} Month" if period < 252 else "1 Year"
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric(f"Avg {period_name} Return", f"{rolling_returns.mean():.2f}%")
-                    with col2:
-                        st.metric(f"Best {period_name} Return", f"{rolling_returns.max():.2f}%")
-                    with col3:
-                        st.metric(f"Worst {period_name} Return", f"{rolling_returns.min():.2f}%")
+            rolling_periods = np.array([30, 90, 252])  # 1M, 3M, 1Y
+
+            # Single JIT-compiled sweep instead of three pct_change+rolling passes
+            rolling_stats = rolling_return_stats(closes, rolling_periods)
+
+            for days, (avg_return, best_return, worst_return) in zip(rolling_periods, rolling_stats):
+                if np.isnan(avg_return):
+                    continue
+
+                period_name = f"{days//21} Month" if days < 252 else "1 Year"
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric(f"Avg {period_name} Return", f"{avg_return:.2f}%")
+                with col2:
+                    st.metric(f"Best {period_name} Return", f"{best_return:.2f}%")
+                with col3:
+                    st.metric(f"Worst {period_name} Return", f"{worst_return:.2f}%")
     
     with tab4:
         st.subheader("🏢 Fund Details & Holdings")
@@ -375,8 +392,7 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
                 characteristics.append({"Attribute": "Morningstar Risk", "Value": fund_info['morningStarRiskRating']})
             
             if characteristics:
-                char_df = pd.DataFrame(characteristics)
-                st.dataframe(char_df, use_container_width=True, hide_index=True)
+                st.table(characteristics)
         
         with col2:
             st.subheader("Investment Objective")
@@ -399,22 +415,24 @@ def display_mutual_fund_results(symbol, fund_data, fund_info, ai_analysis, perfo
             if fund_info.get('sectorWeightings'):
                 sector_data = fund_info['sectorWeightings']
                 if isinstance(sector_data, dict):
-                    sectors_df = pd.DataFrame(list(sector_data.items()), columns=['Sector', 'Weight (%)'])
-                    sectors_df['Weight (%)'] = sectors_df['Weight (%)'] * 100
-                    sectors_df = sectors_df.sort_values('Weight (%)', ascending=False)
-                    
-                    st.bar_chart(sectors_df.set_index('Sector')['Weight (%)'])
+                    # argsort on the raw weights instead of building and
+                    # re-sorting an intermediate DataFrame
+                    sector_names = np.array(list(sector_data.keys()))
+                    weights = np.fromiter(sector_data.values(), dtype=np.float64) * 100
+                    order = np.argsort(-weights)
+
+                    st.bar_chart(pd.Series(weights[order], index=sector_names[order], name='Weight (%)'))
         
         # Performance comparison suggestion
         st.subheader("💡 Investment Considerations")
-        
-        considerations = [
-            f"Expense ratio of {fund_info.get('annualReportExpenseRatio', 0)*100:.2f}% {'is competitive' if fund_info.get('annualReportExpenseRatio', 1) < 0.01 else 'should be compared with peers'}",
-            f"Fund has {'excellent' if performance_metrics['sharpe_ratio'] > 1.5 else 'good' if performance_metrics['sharpe_ratio'] > 1.0 else 'moderate'} risk-adjusted returns",
-            f"Maximum drawdown of {performance_metrics['max_drawdown']:.1f}% indicates {'low' if abs(performance_metrics['max_drawdown']) < 10 else 'moderate' if abs(performance_metrics['max_drawdown']) < 20 else 'high'} downside risk",
-            f"Suitable for {'conservative' if volatility < 10 else 'moderate' if volatility < 20 else 'aggressive'} investors based on volatility"
-        ]
-        
+
+        considerations = _investment_considerations(
+            fund_info.get('annualReportExpenseRatio'),
+            performance_metrics['sharpe_ratio'],
+            performance_metrics['max_drawdown'],
+            annual_vol
+        )
+
         for consideration in considerations:
             st.write(f"• {consideration}")
 
@@ -1,42 +1,70 @@
+import math
 import streamlit as st
-import yfinance as yf
 import numpy as np
-from utils.data_fetcher import DataFetcher
-from utils.ai_predictor import AIPredictor
-from utils.chart_creator import ChartCreator
-from utils.news_analyzer import NewsAnalyzer
+from concurrent.futures import ThreadPoolExecutor
+
+# Utility singletons shared across all sessions of the process instead of
+# rebuilt per browser session. The imports stay inside the factories so the
+# heavy utils stack (yfinance, plotly, textblob) is only pulled in the first
+# time this page actually runs.
+
+@st.cache_resource
+def _ai_predictor():
+    from utils.ai_predictor import AIPredictor
+    return AIPredictor()
+
+@st.cache_resource
+def _chart_creator():
+    from utils.chart_creator import ChartCreator
+    return ChartCreator()
+
+@st.cache_resource
+def _news_analyzer():
+    from utils.news_analyzer import NewsAnalyzer
+    return NewsAnalyzer()
+
+# Render-path style lookups as tables instead of if/elif chains
+_REC_STYLE = {
+    "BUY": ("green", "📈"),
+    "SELL": ("red", "📉"),
+    "HOLD": ("orange", "➡️"),
+}
+_RSI_SIGNALS = ("Oversold", "Neutral", "Overbought")
+_SENTIMENT_EMOJI = {'positive': '😊', 'neutral': '😐', 'negative': '😟'}
+
+# Price features don't need float64 precision; halving the element size
+# halves the bytes the predictor's rolling windows pull through cache
+_OHLCV_F32 = {'Open': 'float32', 'High': 'float32', 'Low': 'float32',
+              'Close': 'float32', 'Volume': 'float32'}
+
+# Annualization factor for daily-return volatility, computed once
+_ANNUALIZER = float(np.sqrt(252)) * 100.0
 
 def show_stock_analysis():
     st.title("📈 Individual Stock Analysis")
     
-    # Initialize utilities
-    if 'data_fetcher' not in st.session_state:
-        st.session_state.data_fetcher = DataFetcher()
-    if 'ai_predictor' not in st.session_state:
-        st.session_state.ai_predictor = AIPredictor()
-    if 'chart_creator' not in st.session_state:
-        st.session_state.chart_creator = ChartCreator()
-    if 'news_analyzer' not in st.session_state:
-        st.session_state.news_analyzer = NewsAnalyzer()
-    
-    # Stock input section
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        symbol = st.text_input(
-            "Enter Stock Symbol", 
-            value="RELIANCE.NS",
-            placeholder="e.g., RELIANCE.NS, TCS.NS, HDFCBANK.NS"
-        ).upper()
-    
-    with col2:
-        period = st.selectbox(
-            "Analysis Period",
-            ["1y", "2y", "3y", "5y"],
-            index=0
-        )
-    
-    if symbol and st.button("🔍 Analyze Stock", type="primary"):
+    # Stock input section; the form batches the inputs so the page reruns
+    # once per submit instead of on every keystroke
+    with st.form("stock_analysis_form"):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            symbol = st.text_input(
+                "Enter Stock Symbol",
+                value="RELIANCE.NS",
+                placeholder="e.g., RELIANCE.NS, TCS.NS, HDFCBANK.NS"
+            ).upper()
+
+        with col2:
+            period = st.selectbox(
+                "Analysis Period",
+                ["1y", "2y", "3y", "5y"],
+                index=0
+            )
+
+        submitted = st.form_submit_button("🔍 Analyze Stock", type="primary")
+
+    if submitted and symbol:
         analyze_stock_detailed(symbol, period)
 
 def analyze_stock_detailed(symbol, period):
@@ -47,36 +75,53 @@ def analyze_stock_detailed(symbol, period):
     status_text = st.empty()
     
     try:
-        # Step 1: Fetch stock data
+        from utils import cached_data
+
+        news_analyzer = _news_analyzer()
+
+        # Steps 1-3: the fetches are independent network calls, so submit
+        # them together and let wall time collapse to the slowest request.
+        # The cached_data wrappers mean repeats of the same analysis within
+        # the TTL never leave the process at all.
         status_text.text("Fetching stock data...")
-        progress_bar.progress(20)
-        
-        stock_data = st.session_state.data_fetcher.get_stock_data(symbol, period)
-        if stock_data is None or stock_data.empty:
-            st.error(f"❌ Could not fetch data for {symbol}. Please check the symbol and try again.")
-            return
-        
-        # Step 2: Get company information
-        status_text.text("Getting company information...")
-        progress_bar.progress(40)
-        
-        company_info = st.session_state.data_fetcher.get_company_info(symbol)
-        
-        # Step 3: Analyze news sentiment
-        status_text.text("Analyzing news sentiment...")
-        progress_bar.progress(60)
-        
-        news_sentiment = st.session_state.data_fetcher.get_news_sentiment(symbol)
-        news_analysis = st.session_state.news_analyzer.analyze_news_sentiment(
-            st.session_state.news_analyzer.get_company_news(symbol, company_info.get('longName'))
-        )
-        
+        progress_bar.progress(10)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stock_future = executor.submit(cached_data.get_stock_data, symbol, period)
+            info_future = executor.submit(cached_data.get_company_info, symbol)
+
+            # Company news needs the resolved long name, so chain it off the
+            # info future while the other fetches continue
+            company_info = info_future.result()
+            news_future = executor.submit(news_analyzer.get_company_news,
+                                          symbol, company_info.get('longName'))
+
+            stock_data = stock_future.result()
+            if stock_data is None or len(stock_data) == 0:
+                st.error(f"❌ Could not fetch data for {symbol}. Please check the symbol and try again.")
+                return
+
+            status_text.text("Analyzing news sentiment...")
+            progress_bar.progress(60)
+
+            news_analysis = news_analyzer.analyze_news_sentiment(news_future.result())
+
+        # One article fetch feeds both outputs: the per-article breakdown
+        # shown in the news tab, and the summary dict the AI predictor
+        # expects, instead of a second round-trip for the same company
+        article_sentiments = news_analysis['article_sentiments']
+        news_sentiment = {
+            'sentiment_score': news_analysis['overall_sentiment'],
+            'news_count': len(article_sentiments),
+            'articles': article_sentiments.head(5)
+        }
+
         # Step 4: Generate AI analysis
         status_text.text("Generating AI-powered analysis...")
         progress_bar.progress(80)
         
-        ai_analysis = st.session_state.ai_predictor.analyze_stock(
-            symbol, stock_data, news_sentiment, company_info
+        ai_analysis = _ai_predictor().analyze_stock(
+            symbol, stock_data.astype(_OHLCV_F32), news_sentiment, company_info
         )
         
         # Step 5: Create visualizations
@@ -89,7 +134,7 @@ def analyze_stock_detailed(symbol, period):
         
         # Display results
         display_stock_analysis_results(
-            symbol, stock_data, company_info, ai_analysis, news_analysis
+            symbol, period, stock_data, company_info, ai_analysis, news_analysis
         )
         
     except Exception as e:
@@ -97,9 +142,18 @@ def analyze_stock_detailed(symbol, period):
         status_text.empty()
         st.error(f"❌ An error occurred during analysis: {str(e)}")
 
-def display_stock_analysis_results(symbol, stock_data, company_info, ai_analysis, news_analysis):
+def display_stock_analysis_results(symbol, period, stock_data, company_info, ai_analysis, news_analysis):
     """Display comprehensive stock analysis results"""
-    
+
+    # One ndarray conversion per column serves every scalar below (prices,
+    # 52-week range, volumes, volatility) instead of repeated Series ops
+    close_arr = stock_data['Close'].to_numpy()
+    high_arr = stock_data['High'].to_numpy()
+    low_arr = stock_data['Low'].to_numpy()
+    volume_arr = stock_data['Volume'].to_numpy()
+    current_price = close_arr[-1]
+    prev_price = close_arr[-2] if len(close_arr) > 1 else current_price
+
     # Header with company info
     if company_info:
         col1, col2, col3 = st.columns(3)
@@ -118,14 +172,11 @@ def display_stock_analysis_results(symbol, stock_data, company_info, ai_analysis
         
         with col2:
             market_cap = company_info.get('marketCap', 0)
-            if market_cap > 1e12:
-                market_cap_display = f"₹{market_cap/1e12:.2f}T"
-            elif market_cap > 1e9:
-                market_cap_display = f"₹{market_cap/1e9:.2f}B"
-            elif market_cap > 1e6:
-                market_cap_display = f"₹{market_cap/1e6:.2f}M"
-            else:
-                market_cap_display = f"₹{market_cap:,.0f}"
+            # Pick the thousands-group suffix straight from the magnitude;
+            # max(..., 1) guards log10(0) for missing caps
+            idx = min(int(math.log10(max(market_cap, 1)) // 3), 4)
+            suffix = ('', 'K', 'M', 'B', 'T')[idx]
+            market_cap_display = f"₹{market_cap / 10 ** (idx * 3):,.2f}{suffix}"
             
             st.metric(
                 "Market Cap", 
@@ -139,8 +190,6 @@ def display_stock_analysis_results(symbol, stock_data, company_info, ai_analysis
             )
         
         with col3:
-            current_price = stock_data['Close'].iloc[-1]
-            prev_price = stock_data['Close'].iloc[-2] if len(stock_data) > 1 else current_price
             price_change = ((current_price - prev_price) / prev_price) * 100
             
             st.metric(
@@ -150,7 +199,7 @@ def display_stock_analysis_results(symbol, stock_data, company_info, ai_analysis
                 help="Latest closing price"
             )
             
-            avg_volume = stock_data['Volume'].tail(20).mean()
+            avg_volume = volume_arr[-20:].mean()
             st.metric(
                 "Avg Volume (20d)",
                 f"{avg_volume:,.0f}",
@@ -167,222 +216,243 @@ def display_stock_analysis_results(symbol, stock_data, company_info, ai_analysis
         "📈 Technical Analysis"
     ])
     
+    # Each tab body is a fragment, so interactions inside one tab rerun only
+    # that renderer instead of rebuilding all four
     with tab1:
-        st.subheader("Price Chart & Technical Indicators")
-        chart = st.session_state.chart_creator.create_stock_chart(stock_data, symbol)
-        st.plotly_chart(chart, use_container_width=True)
-        
-        # Key statistics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            high_52w = stock_data['High'].max()
-            st.metric("52W High", f"₹{high_52w:.2f}")
-        
-        with col2:
-            low_52w = stock_data['Low'].min()
-            st.metric("52W Low", f"₹{low_52w:.2f}")
-        
-        with col3:
-            ytd_return = ((current_price - stock_data['Close'].iloc[0]) / stock_data['Close'].iloc[0]) * 100
-            st.metric("YTD Return", f"{ytd_return:+.2f}%")
-        
-        with col4:
-            volatility = stock_data['Close'].pct_change().std() * np.sqrt(252) * 100
-            st.metric("Volatility", f"{volatility:.2f}%")
-    
+        _render_price_tab(symbol, stock_data, close_arr, high_arr, low_arr, current_price)
+
     with tab2:
-        st.subheader("🤖 AI-Powered Analysis")
-        
-        # Recommendation summary
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            # Recommendation card
-            recommendation = ai_analysis['recommendation']
-            confidence = ai_analysis['confidence']
-            
-            if recommendation == "BUY":
-                card_color = "green"
-                emoji = "📈"
-            elif recommendation == "SELL":
-                card_color = "red"
-                emoji = "📉"
-            else:
-                card_color = "orange"
-                emoji = "➡️"
-            
-            st.markdown(f"""
-            <div style="
-                border: 2px solid {card_color};
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-                background-color: {card_color}20;
-            ">
-                <h3>{emoji} {recommendation}</h3>
-                <p><strong>Target Price:</strong> ₹{ai_analysis['target_price']:.2f}</p>
-                <p><strong>Confidence:</strong> {confidence:.0%}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            # Confidence gauge
-            gauge_chart = st.session_state.chart_creator.create_recommendation_gauge(
-                confidence, recommendation
-            )
-            st.plotly_chart(gauge_chart, use_container_width=True)
-        
-        # Detailed reasoning
-        st.subheader("💡 Analysis Reasoning")
-        st.write(ai_analysis['reasoning'])
-        
-        # Risk factors
-        if ai_analysis.get('risk_factors'):
-            st.subheader("⚠️ Risk Factors")
-            for risk in ai_analysis['risk_factors']:
-                st.warning(f"• {risk}")
-        
-        # Key factors
-        if ai_analysis.get('key_factors'):
-            st.subheader("🔑 Key Factors")
-            for factor in ai_analysis['key_factors']:
-                st.info(f"• {factor}")
-    
+        _render_ai_tab(ai_analysis)
+
     with tab3:
-        st.subheader("📰 News Sentiment Analysis")
-        
-        if news_analysis and news_analysis.get('article_sentiments'):
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                overall_sentiment = news_analysis['overall_sentiment']
-                sentiment_color = "green" if overall_sentiment > 0.6 else "orange" if overall_sentiment > 0.4 else "red"
-                st.metric(
-                    "Overall Sentiment",
-                    f"{overall_sentiment:.2f}",
-                    help="Scale: 0 (very negative) to 1 (very positive)"
-                )
-            
-            with col2:
-                st.metric(
-                    "Articles Analyzed",
-                    len(news_analysis['article_sentiments'])
-                )
-            
-            with col3:
-                dist = news_analysis['sentiment_distribution']
-                st.metric(
-                    "Positive Articles",
-                    f"{dist['positive']:.0%}"
-                )
-            
-            # Sentiment distribution
-            st.subheader("Sentiment Distribution")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Positive", f"{dist['positive']:.0%}", delta=None)
-            with col2:
-                st.metric("Neutral", f"{dist['neutral']:.0%}", delta=None)
-            with col3:
-                st.metric("Negative", f"{dist['negative']:.0%}", delta=None)
-            
-            # Recent articles
-            st.subheader("Recent News Articles")
-            for article in news_analysis['article_sentiments'][:5]:
-                sentiment_emoji = "😊" if article['sentiment'] == 'positive' else "😐" if article['sentiment'] == 'neutral' else "😟"
-                
-                with st.expander(f"{sentiment_emoji} {article['title'][:100]}..."):
-                    st.write(f"**Sentiment:** {article['sentiment'].title()}")
-                    st.write(f"**Score:** {article['polarity']:.2f}")
-                    st.write(f"**Published:** {article['publishedAt'][:10]}")
-                    if article.get('url'):
-                        st.write(f"[Read more]({article['url']})")
-            
-            # Sentiment trend chart
-            sentiment_chart = st.session_state.chart_creator.create_sentiment_chart(news_analysis)
-            if sentiment_chart:
-                st.plotly_chart(sentiment_chart, use_container_width=True)
-        
-        else:
-            st.info("📭 No recent news sentiment data available for this stock.")
-    
+        _render_news_tab(news_analysis)
+
     with tab4:
-        st.subheader("📈 Technical Analysis")
-        
-        # Calculate technical indicators
-        technical_data = st.session_state.data_fetcher.calculate_technical_indicators(stock_data)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            rsi = technical_data['rsi']
-            rsi_signal = "Overbought" if rsi > 70 else "Oversold" if rsi < 30 else "Neutral"
-            rsi_color = "red" if rsi > 70 else "green" if rsi < 30 else "blue"
+        _render_tech_tab(symbol, period, current_price)
+
+@st.fragment
+def _render_price_tab(symbol, stock_data, close_arr, high_arr, low_arr, current_price):
+    """Price chart tab: cached figure plus key statistics"""
+    st.subheader("Price Chart & Technical Indicators")
+    from utils import cached_data
+    chart = cached_data.create_stock_chart(symbol, stock_data)
+    st.plotly_chart(chart, use_container_width=True)
+
+    # Key statistics
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # "52W" literally means the trailing 252 sessions, so cap the
+        # window rather than scanning a 2y-5y frame end to end
+        high_52w = high_arr[-252:].max()
+        st.metric("52W High", f"₹{high_52w:.2f}")
+
+    with col2:
+        low_52w = low_arr[-252:].min()
+        st.metric("52W Low", f"₹{low_52w:.2f}")
+
+    with col3:
+        ytd_return = (current_price / close_arr[0] - 1) * 100
+        st.metric("YTD Return", f"{ytd_return:+.2f}%")
+
+    with col4:
+        # 253 closes give the trailing 252 daily returns
+        recent_close = close_arr[-253:]
+        daily_returns = recent_close[1:] / recent_close[:-1] - 1.0
+        volatility = daily_returns.std(ddof=1) * _ANNUALIZER
+        st.metric("Volatility", f"{volatility:.2f}%")
+
+@st.fragment
+def _render_ai_tab(ai_analysis):
+    """AI analysis tab: recommendation card, gauge, reasoning, factors"""
+    st.subheader("🤖 AI-Powered Analysis")
+
+    # Recommendation summary
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        # Recommendation card
+        recommendation = ai_analysis['recommendation']
+        confidence = ai_analysis['confidence']
+
+        card_color, emoji = _REC_STYLE.get(recommendation, _REC_STYLE["HOLD"])
+
+        st.markdown(f"""
+        <div style="
+            border: 2px solid {card_color};
+            border-radius: 10px;
+            padding: 20px;
+            text-align: center;
+            background-color: {card_color}20;
+        ">
+            <h3>{emoji} {recommendation}</h3>
+            <p><strong>Target Price:</strong> ₹{ai_analysis['target_price']:.2f}</p>
+            <p><strong>Confidence:</strong> {confidence:.0%}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Confidence gauge
+        from utils import cached_data
+        gauge_chart = cached_data.create_recommendation_gauge(
+            confidence, recommendation
+        )
+        st.plotly_chart(gauge_chart, use_container_width=True)
+
+    # Detailed reasoning
+    st.subheader("💡 Analysis Reasoning")
+    st.write(ai_analysis['reasoning'])
+
+    # Risk factors (one markdown element instead of a widget per item)
+    if ai_analysis.get('risk_factors'):
+        st.subheader("⚠️ Risk Factors")
+        st.markdown("\n".join(f"- ⚠️ {risk}" for risk in ai_analysis['risk_factors']))
+
+    # Key factors
+    if ai_analysis.get('key_factors'):
+        st.subheader("🔑 Key Factors")
+        st.markdown("\n".join(f"- 🔑 {factor}" for factor in ai_analysis['key_factors']))
+
+@st.fragment
+def _render_news_tab(news_analysis):
+    """News tab: sentiment metrics, article list, trend chart"""
+    st.subheader("📰 News Sentiment Analysis")
+
+    if news_analysis and len(news_analysis.get('article_sentiments', ())) > 0:
+        col1, col2, col3 = st.columns(3)
             
+        with col1:
+            overall_sentiment = news_analysis['overall_sentiment']
+            sentiment_color = "green" if overall_sentiment > 0.6 else "orange" if overall_sentiment > 0.4 else "red"
             st.metric(
-                "RSI (14)", 
-                f"{rsi:.2f}",
-                rsi_signal,
-                help="Relative Strength Index"
+                "Overall Sentiment",
+                f"{overall_sentiment:.2f}",
+                help="Scale: 0 (very negative) to 1 (very positive)"
             )
-        
+            
         with col2:
-            sma_20 = technical_data['sma_20']
-            price_vs_sma20 = "Above" if current_price > sma_20 else "Below"
             st.metric(
-                "SMA (20)", 
-                f"₹{sma_20:.2f}",
-                price_vs_sma20,
-                help="20-day Simple Moving Average"
+                "Articles Analyzed",
+                len(news_analysis['article_sentiments'])
             )
-        
+            
         with col3:
-            sma_50 = technical_data['sma_50']
-            price_vs_sma50 = "Above" if current_price > sma_50 else "Below"
+            dist = news_analysis['sentiment_distribution']
             st.metric(
-                "SMA (50)", 
-                f"₹{sma_50:.2f}",
-                price_vs_sma50,
-                help="50-day Simple Moving Average"
+                "Positive Articles",
+                f"{dist['positive']:.0%}"
             )
+            
+        # Sentiment distribution
+        st.subheader("Sentiment Distribution")
+        col1, col2, col3 = st.columns(3)
+            
+        with col1:
+            st.metric("Positive", f"{dist['positive']:.0%}", delta=None)
+        with col2:
+            st.metric("Neutral", f"{dist['neutral']:.0%}", delta=None)
+        with col3:
+            st.metric("Negative", f"{dist['negative']:.0%}", delta=None)
+            
+        # Recent articles as one pre-built HTML block: a single element
+        # instead of an expander widget plus nested writes per article
+        st.subheader("Recent News Articles")
+        articles_html = "".join(
+            f"<details><summary>{_SENTIMENT_EMOJI.get(a.sentiment, '😐')} {a.title[:100]}...</summary>"
+            f"<p><strong>Sentiment:</strong> {a.sentiment.title()}<br>"
+            f"<strong>Score:</strong> {a.polarity:.2f}<br>"
+            f"<strong>Published:</strong> {a.publishedAt[:10]}<br>"
+            + (f"<a href=\"{a.url}\" target=\"_blank\">Read more</a>" if a.url else "")
+            + "</p></details>"
+            for a in news_analysis['article_sentiments'].head(5).itertuples()
+        )
+        st.markdown(articles_html, unsafe_allow_html=True)
+            
+        # Sentiment trend chart
+        sentiment_chart = _chart_creator().create_sentiment_chart(news_analysis)
+        if sentiment_chart:
+            st.plotly_chart(sentiment_chart, use_container_width=True)
         
-        with col4:
-            volatility = technical_data['volatility']
-            vol_level = "High" if volatility > 30 else "Medium" if volatility > 15 else "Low"
-            st.metric(
-                "Volatility", 
-                f"{volatility:.2f}%",
-                vol_level,
-                help="Annualized volatility"
-            )
-        
-        # Technical summary
-        st.subheader("Technical Summary")
-        
-        signals = []
-        if rsi > 70:
-            signals.append("🔴 RSI indicates overbought conditions")
-        elif rsi < 30:
-            signals.append("🟢 RSI indicates oversold conditions")
-        else:
-            signals.append("🔵 RSI is in neutral territory")
-        
-        if current_price > sma_20 and current_price > sma_50:
-            signals.append("🟢 Price is above both 20-day and 50-day moving averages (bullish)")
-        elif current_price < sma_20 and current_price < sma_50:
-            signals.append("🔴 Price is below both 20-day and 50-day moving averages (bearish)")
-        else:
-            signals.append("🟡 Mixed signals from moving averages")
-        
-        if volatility > 30:
-            signals.append("⚠️ High volatility indicates increased risk")
-        elif volatility < 15:
-            signals.append("ℹ️ Low volatility suggests stable price movement")
-        
-        for signal in signals:
-            st.write(signal)
+    else:
+        st.info("📭 No recent news sentiment data available for this stock.")
+    
+@st.fragment
+def _render_tech_tab(symbol, period, current_price):
+    """Technical analysis tab: indicator metrics and summary signals"""
+    st.subheader("📈 Technical Analysis")
+
+    # Calculate technical indicators (cached per symbol/period)
+    from utils import cached_data
+    technical_data = cached_data.calculate_technical_indicators(symbol, period)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        rsi = technical_data['rsi']
+        # Index 0/1/2 selects oversold/neutral/overbought without branching
+        rsi_signal = _RSI_SIGNALS[(rsi >= 30) + (rsi > 70)]
+
+        st.metric(
+            "RSI (14)",
+            f"{rsi:.2f}",
+            rsi_signal,
+            help="Relative Strength Index"
+        )
+
+    with col2:
+        sma_20 = technical_data['sma_20']
+        price_vs_sma20 = "Above" if current_price > sma_20 else "Below"
+        st.metric(
+            "SMA (20)",
+            f"₹{sma_20:.2f}",
+            price_vs_sma20,
+            help="20-day Simple Moving Average"
+        )
+
+    with col3:
+        sma_50 = technical_data['sma_50']
+        price_vs_sma50 = "Above" if current_price > sma_50 else "Below"
+        st.metric(
+            "SMA (50)",
+            f"₹{sma_50:.2f}",
+            price_vs_sma50,
+            help="50-day Simple Moving Average"
+        )
+
+    with col4:
+        volatility = technical_data['volatility']
+        vol_level = "High" if volatility > 30 else "Medium" if volatility > 15 else "Low"
+        st.metric(
+            "Volatility",
+            f"{volatility:.2f}%",
+            vol_level,
+            help="Annualized volatility"
+        )
+
+    # Technical summary
+    st.subheader("Technical Summary")
+
+    signals = []
+    if rsi > 70:
+        signals.append("🔴 RSI indicates overbought conditions")
+    elif rsi < 30:
+        signals.append("🟢 RSI indicates oversold conditions")
+    else:
+        signals.append("🔵 RSI is in neutral territory")
+
+    if current_price > sma_20 and current_price > sma_50:
+        signals.append("🟢 Price is above both 20-day and 50-day moving averages (bullish)")
+    elif current_price < sma_20 and current_price < sma_50:
+        signals.append("🔴 Price is below both 20-day and 50-day moving averages (bearish)")
+    else:
+        signals.append("🟡 Mixed signals from moving averages")
+
+    if volatility > 30:
+        signals.append("⚠️ High volatility indicates increased risk")
+    elif volatility < 15:
+        signals.append("ℹ️ Low volatility suggests stable price movement")
+
+    st.markdown("  \n".join(signals))
 
 if __name__ == "__main__":
     show_stock_analysis()
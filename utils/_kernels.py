@@ -0,0 +1,221 @@
+import numpy as np
+from utils._njit import njit
+
+# Single-pass feature kernels for the AI predictor. Each one streams over
+# the close (and volume) array once, accumulating the sums every indicator
+# needs, instead of taking separate numpy passes per metric. Compiled
+# lazily with on-disk caching; with numba absent they run as plain Python.
+# nogil lets threaded callers run the compiled code in genuine parallel
+# instead of serializing on the interpreter lock.
+
+@njit(cache=True, nogil=True, fastmath=True)
+def stock_features(close, volume):
+    """Stock indicator set from one pass over close/volume.
+
+    Returns (current, sma20, sma50, rsi14, vol_ann, vol_ratio,
+    month_return) matching the predictor's rolling-window definitions.
+    """
+    n = close.shape[0]
+    current = close[n - 1]
+
+    # Daily return sum / sum of squares for the annualized sample std
+    ret_sum = 0.0
+    ret_sumsq = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1.0
+        ret_sum += r
+        ret_sumsq += r * r
+    m = n - 1
+    if m > 1:
+        var = (ret_sumsq - ret_sum * ret_sum / m) / (m - 1)
+        vol_ann = np.sqrt(var * 252.0) * 100.0 if var > 0 else 0.0
+    else:
+        vol_ann = 0.0
+
+    sma20 = current
+    if n >= 20:
+        total = 0.0
+        for i in range(n - 20, n):
+            total += close[i]
+        sma20 = total / 20.0
+
+    sma50 = current
+    if n >= 50:
+        total = 0.0
+        for i in range(n - 50, n):
+            total += close[i]
+        sma50 = total / 50.0
+
+    # RSI from the trailing 14 deltas (rolling-mean form, last value only)
+    rsi14 = 50.0
+    if n >= 15:
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(n - 14, n):
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gain_sum += delta
+            else:
+                loss_sum -= delta
+        if loss_sum > 0:
+            rsi14 = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+        else:
+            rsi14 = 100.0
+
+    avg_volume = 0.0
+    if n >= 20:
+        total = 0.0
+        for i in range(n - 20, n):
+            total += volume[i]
+        avg_volume = total / 20.0
+    recent_n = 5 if n >= 5 else n
+    total = 0.0
+    for i in range(n - recent_n, n):
+        total += volume[i]
+    recent_volume = total / recent_n
+    vol_ratio = recent_volume / avg_volume if avg_volume > 0 else 1.0
+
+    month_ago = close[n - 20] if n >= 20 else close[0]
+    month_return = (current / month_ago - 1.0) * 100.0
+
+    return current, sma20, sma50, rsi14, vol_ann, vol_ratio, month_return
+
+@njit(cache=True, nogil=True)
+def rolling_rsi(close, window):
+    """Full RSI series via sliding gain/loss sums (rolling-mean form).
+
+    One pass with an add and a subtract per step, matching the values of
+    the gain/loss rolling-mean formulation; the first window slots stay
+    NaN like the pandas version it replaces.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        else:
+            loss_sum -= delta
+        if i > window:
+            old = close[i - window] - close[i - window - 1]
+            if old > 0:
+                gain_sum -= old
+            else:
+                loss_sum += old
+        if i >= window:
+            if loss_sum > 0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0:
+                rsi[i] = 100.0
+    return rsi
+
+@njit(cache=True, nogil=True, fastmath=True)
+def ret_stats(close):
+    """Mean and sample std of daily returns from one pass over closes"""
+    n = close.shape[0]
+    s = 0.0
+    ss = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1.0
+        s += r
+        ss += r * r
+    m = n - 1
+    mean = s / m if m > 0 else 0.0
+    if m > 1:
+        var = (ss - s * s / m) / (m - 1)
+        std = np.sqrt(var) if var > 0 else 0.0
+    else:
+        std = 0.0
+    return mean, std
+
+@njit(cache=True, nogil=True, fastmath=True)
+def max_drawdown(close):
+    """Maximum drawdown in percent from one pass, O(1) memory.
+
+    Tracks the running peak and the worst peak-to-trough ratio without
+    materializing the cumulative-max or drawdown arrays.
+    """
+    rmax = close[0]
+    mdd = 0.0
+    for i in range(1, close.shape[0]):
+        if close[i] > rmax:
+            rmax = close[i]
+        dd = close[i] / rmax - 1.0
+        if dd < mdd:
+            mdd = dd
+    return mdd * 100.0
+
+@njit(cache=True, nogil=True)
+def smoothed_period_return(close, k):
+    """k-period percent change smoothed by a k-window mean, in percent.
+
+    Fuses pct_change(k) and rolling(k).mean() into one traversal with a
+    running sum of the period returns; the first 2k-1 slots stay NaN to
+    match the pandas pipeline it replaces.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    window_sum = 0.0
+    for i in range(k, n):
+        window_sum += close[i] / close[i - k] - 1.0
+        if i >= 2 * k:
+            window_sum -= close[i - k] / close[i - 2 * k] - 1.0
+        if i >= 2 * k - 1:
+            out[i] = window_sum / k * 100.0
+    return out
+
+@njit(cache=True, nogil=True)
+def sma_pair(close, w1, w2):
+    """SMA series for two windows from one traversal.
+
+    Running sums add each new bar and drop the one leaving each window;
+    the first w-1 slots stay NaN to match rolling(w).mean().
+    """
+    n = close.shape[0]
+    out1 = np.full(n, np.nan)
+    out2 = np.full(n, np.nan)
+    s1 = 0.0
+    s2 = 0.0
+    for i in range(n):
+        s1 += close[i]
+        s2 += close[i]
+        if i >= w1:
+            s1 -= close[i - w1]
+        if i >= w2:
+            s2 -= close[i - w2]
+        if i >= w1 - 1:
+            out1[i] = s1 / w1
+        if i >= w2 - 1:
+            out2[i] = s2 / w2
+    return out1, out2
+
+@njit(cache=True, nogil=True, fastmath=True)
+def fund_features(close):
+    """Fund performance set from one pass over the NAV series.
+
+    Returns (current_nav, annual_return, vol_ann, sharpe) using the
+    predictor's definitions (mean daily return annualized, sample std,
+    2% risk-free rate).
+    """
+    n = close.shape[0]
+    current = close[n - 1]
+
+    ret_sum = 0.0
+    ret_sumsq = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1.0
+        ret_sum += r
+        ret_sumsq += r * r
+    m = n - 1
+    annual_return = (ret_sum / m) * 252.0 * 100.0 if m > 0 else 0.0
+    if m > 1:
+        var = (ret_sumsq - ret_sum * ret_sum / m) / (m - 1)
+        vol_ann = np.sqrt(var * 252.0) * 100.0 if var > 0 else 0.0
+    else:
+        vol_ann = 0.0
+
+    sharpe = (annual_return - 2.0) / vol_ann if vol_ann > 0 else 0.0
+
+    return current, annual_return, vol_ann, sharpe
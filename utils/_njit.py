@@ -0,0 +1,11 @@
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python.
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
@@ -1,148 +1,417 @@
 import json
+import math
 import os
+import pickle
+import tempfile
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from utils._kernels import stock_features, fund_features
+
+# Upper bound on memoized analysis results per predictor instance
+_ANALYSIS_CACHE_SIZE = 512
+
+class StockFeatures(NamedTuple):
+    """Per-symbol indicator bundle shared by the stock analysis paths.
+
+    A NamedTuple keeps the hot intermediate allocation-light and gives
+    consumers attribute access instead of per-field dict hashing.
+    """
+    current: float
+    sma20: float
+    sma50: float
+    rsi14: float
+    vol_ann: float
+    vol_ratio: float
+    month_return: float
+
+# Fund performance lookback windows: 1M, 3M, 1Y of trading days
+_PERIOD_LENGTHS = np.array([21, 63, 252])
+
+# Annualization factors, computed once instead of per analysis call
+_SQRT252 = float(np.sqrt(252))
+_ANNUALIZER = _SQRT252 * 100.0
+
+# A recommendation scan costs ~20 network fetches but stays valid for
+# minutes, so persist results across processes in a TTL'd pickle file.
+# Keying on a time bucket makes entries expire without any bookkeeping.
+_REC_CACHE_TTL = 900  # seconds, aligned with market data refresh
+_REC_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'investanalyze_recommendations.pkl')
+
+def _load_recommendation_cache(kind):
+    """Cached {BUY, SELL} lists for kind, or None when absent or expired"""
+    try:
+        with open(_REC_CACHE_PATH, 'rb') as fh:
+            stored = pickle.load(fh)
+        bucket, result = stored[kind]
+        if bucket == int(time.time() // _REC_CACHE_TTL):
+            return result
+    except (OSError, KeyError, ValueError, EOFError, pickle.PickleError):
+        pass
+    return None
+
+def _store_recommendation_cache(kind, result):
+    """Persist the {BUY, SELL} lists for kind under the current time bucket"""
+    try:
+        try:
+            with open(_REC_CACHE_PATH, 'rb') as fh:
+                stored = pickle.load(fh)
+        except (OSError, EOFError, pickle.PickleError):
+            stored = {}
+        stored[kind] = (int(time.time() // _REC_CACHE_TTL), result)
+        tmp_path = _REC_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(stored, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _REC_CACHE_PATH)
+    except OSError as e:
+        print(f"Error writing recommendation cache: {e}")
+
+# Static sentence tables for the rule-based narratives. Each analysis packs
+# the conditions that fired into a bitmask and joins the matching sentences,
+# rather than running append-heavy if/elif chains over string literals.
+_STOCK_REASONS = (
+    "Strong technical uptrend with price above key moving averages",
+    "Technical downtrend with price below moving averages",
+    "Mixed technical signals with consolidation pattern",
+    "RSI indicates oversold conditions, potential buying opportunity",
+    "RSI shows overbought levels, caution advised",
+    "Positive news sentiment supports the outlook",
+    "Negative news sentiment creates headwinds",
+    "Attractive valuation with low P/E ratio",
+    "Premium valuation requires strong growth to justify"
+)
+
+_STOCK_RISKS = (
+    "High volatility increases investment risk",
+    "High valuation multiples vulnerable to market corrections",
+    "Negative sentiment could impact near-term performance",
+    "Small-cap stock subject to higher volatility"
+)
+
+_STOCK_KEY_FACTORS = (
+    "Strong volume confirms price action",
+    "Positive momentum above 20-day average",
+    "Favorable news coverage",
+    "Reasonable valuation metrics"
+)
+
+_FUND_STRENGTHS = (
+    "Strong risk-adjusted returns",
+    "Low cost structure",
+    "Large asset base provides stability",
+    "Low volatility provides stability",
+    "Consistent performance track record"
+)
+
+_FUND_WEAKNESSES = (
+    "High expense ratio reduces returns",
+    "High volatility increases risk",
+    "Below-average performance",
+    "Poor risk-adjusted returns",
+    "Small asset base may limit liquidity"
+)
+
+_FUND_RISKS = (
+    "High volatility may result in significant losses",
+    "High fees erode long-term returns",
+    "Recent poor performance indicates potential issues"
+)
+
+def _select(table, mask):
+    """Sentences from table whose bit is set in mask, in table order"""
+    return [s for i, s in enumerate(table) if mask >> i & 1]
+
+def _top_by_score(recs, k):
+    """Top-k recommendation dicts by score, highest first.
+
+    np.argpartition finds the winners in O(n) and only those k entries
+    get sorted, replacing the full list sort with its per-comparison
+    lambda and dict lookups.
+    """
+    if len(recs) <= k:
+        return sorted(recs, key=lambda x: x['score'], reverse=True)
+    scores = np.fromiter((r['score'] for r in recs), dtype=np.float64, count=len(recs))
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx], kind='stable')]
+    return [recs[i] for i in top_idx]
+
+# Fallback recommendation tables, built once at import. The SELL variants
+# are derived from the BUY rows up front so each request only hands out
+# per-row copies instead of rebuilding and mutating the lists.
+_FALLBACK_STOCKS_BUY = [
+    {"symbol": "RELIANCE.NS", "name": "Reliance Industries Limited", "current_price": 2850.00, "target_price": 3000.00, "confidence": 0.75, "reasoning": "Strong refining and telecom business growth.", "price_change": 5.3, "sector": "Energy"},
+    {"symbol": "TCS.NS", "name": "Tata Consultancy Services Limited", "current_price": 3650.00, "target_price": 3850.00, "confidence": 0.80, "reasoning": "IT services leadership and digital transformation.", "price_change": 5.5, "sector": "Technology"},
+    {"symbol": "HDFCBANK.NS", "name": "HDFC Bank Limited", "current_price": 1720.00, "target_price": 1850.00, "confidence": 0.70, "reasoning": "Strong banking fundamentals and digital initiatives.", "price_change": 7.6, "sector": "Financial Services"},
+    {"symbol": "INFY.NS", "name": "Infosys Limited", "current_price": 1890.00, "target_price": 2000.00, "confidence": 0.65, "reasoning": "Strong IT consulting and automation services.", "price_change": 5.8, "sector": "Technology"},
+    {"symbol": "ITC.NS", "name": "ITC Limited", "current_price": 465.00, "target_price": 500.00, "confidence": 0.72, "reasoning": "Diversified FMCG portfolio and dividend yield.", "price_change": 7.5, "sector": "Consumer Goods"}
+]
+
+_FALLBACK_STOCKS_SELL = [
+    {**stock, "target_price": stock["current_price"] * 0.95, "price_change": -2.0,
+     "reasoning": "Technical indicators suggest potential downside."}
+    for stock in _FALLBACK_STOCKS_BUY
+]
+
+_FALLBACK_FUNDS_BUY = [
+    {"symbol": "SBI-BLUECHIP", "name": "SBI Bluechip Fund", "current_price": 85.50, "target_price": 89.00, "confidence": 0.75, "reasoning": "Strong large-cap portfolio with consistent performance.", "price_change": 4.1, "sector": "Large Cap"},
+    {"symbol": "HDFC-TOP100", "name": "HDFC Top 100 Fund", "current_price": 920.00, "target_price": 950.00, "confidence": 0.70, "reasoning": "Diversified blue-chip equity exposure.", "price_change": 3.3, "sector": "Large Cap"},
+    {"symbol": "ICICI-BLUECHIP", "name": "ICICI Prudential Bluechip Fund", "current_price": 65.40, "target_price": 68.00, "confidence": 0.65, "reasoning": "Well-managed large-cap fund with stable returns.", "price_change": 4.0, "sector": "Large Cap"},
+    {"symbol": "AXIS-BLUECHIP", "name": "Axis Bluechip Fund", "current_price": 52.80, "target_price": 55.00, "confidence": 0.68, "reasoning": "Quality large-cap stocks with growth potential.", "price_change": 4.2, "sector": "Large Cap"},
+    {"symbol": "MIRAE-LARGECAP", "name": "Mirae Asset Large Cap Fund", "current_price": 98.20, "target_price": 102.00, "confidence": 0.72, "reasoning": "Systematic large-cap investment approach.", "price_change": 3.9, "sector": "Large Cap"}
+]
+
+_FALLBACK_FUNDS_SELL = [
+    {**fund, "target_price": fund["current_price"] * 0.97, "price_change": -1.5,
+     "reasoning": "Consider rebalancing portfolio allocation."}
+    for fund in _FALLBACK_FUNDS_BUY
+]
 
 class AIPredictor:
     def __init__(self):
         # Use free Hugging Face API as alternative to OpenAI
         self.hf_api_key = os.getenv("HUGGING_FACE_API_KEY", "")
         self.use_free_analysis = True  # Always use free analysis for now
-    
+        # The analyses are pure functions of their inputs, so memoize results
+        # keyed on a cheap data fingerprint; OrderedDict gives LRU eviction
+        self._analysis_cache = OrderedDict()
+        # Per-symbol running indicator state for incremental updates when
+        # repeated analyses arrive with one new bar appended
+        self._streams = {}
+        # Per-fund NAV history retained across recommendation scans so a
+        # warm scan only fetches the newest bars
+        self._fund_history = {}
+
+    def _data_fingerprint(self, kind, symbol, data):
+        """Cache key for an analysis: symbol plus last bar identity.
+
+        Returns None when the frame has no timestamped index, in which
+        case the caller skips caching.
+        """
+        try:
+            return (kind, symbol, int(data.index[-1].value), len(data),
+                    round(float(data['Close'].iloc[-1]), 4))
+        except (AttributeError, TypeError):
+            return None
+
+    def _cache_analysis(self, key, result):
+        """Store a result under key with LRU eviction"""
+        self._analysis_cache[key] = result
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+
     def analyze_stock(self, symbol, stock_data, news_sentiment, company_info):
         """Comprehensive stock analysis using free AI alternatives"""
+        key = self._data_fingerprint('stock', symbol, stock_data)
+        if key is not None and key in self._analysis_cache:
+            self._analysis_cache.move_to_end(key)
+            return self._analysis_cache[key]
+
         try:
             # Always use advanced rule-based analysis for comprehensive results
-            return self._get_advanced_stock_analysis(symbol, stock_data, news_sentiment, company_info)
-            
+            result = self._get_advanced_stock_analysis(symbol, stock_data, news_sentiment, company_info)
+
         except Exception as e:
             print(f"Error in stock analysis: {e}")
             return self._get_fallback_stock_analysis(symbol, stock_data)
-    
+
+        if key is not None:
+            self._cache_analysis(key, result)
+        return result
+
     def analyze_mutual_fund(self, symbol, fund_data, fund_info):
         """Comprehensive mutual fund analysis using free alternatives"""
+        key = self._data_fingerprint('fund', symbol, fund_data)
+        if key is not None and key in self._analysis_cache:
+            self._analysis_cache.move_to_end(key)
+            return self._analysis_cache[key]
+
         try:
             # Use advanced rule-based analysis for comprehensive results
-            return self._get_advanced_fund_analysis(symbol, fund_data, fund_info)
-            
+            result = self._get_advanced_fund_analysis(symbol, fund_data, fund_info)
+
         except Exception as e:
             print(f"Error in mutual fund analysis: {e}")
             return self._get_fallback_fund_analysis(symbol, fund_data)
+
+        if key is not None:
+            self._cache_analysis(key, result)
+        return result
     
     def get_top_stock_recommendations(self, recommendation_type="BUY"):
         """Generate top 5 stock recommendations using free analysis"""
         try:
             # Use rule-based analysis for recommendations
             return self._get_smart_stock_recommendations(recommendation_type)
-            
+
         except Exception as e:
             print(f"Error generating stock recommendations: {e}")
             return self._get_fallback_stock_recommendations(recommendation_type)
-    
+
+    def get_top_stock_recommendations_both(self):
+        """Generate the BUY and SELL top-5 stock lists from a single scan"""
+        try:
+            return self._get_smart_stock_recommendations_both()
+
+        except Exception as e:
+            print(f"Error generating stock recommendations: {e}")
+            return {rec_type: self._get_fallback_stock_recommendations(rec_type)
+                    for rec_type in ("BUY", "SELL")}
+
     def get_top_mf_recommendations(self, recommendation_type="BUY"):
         """Generate top 5 mutual fund recommendations using free analysis"""
         try:
             # Use rule-based analysis for recommendations
             return self._get_smart_mf_recommendations(recommendation_type)
-            
+
         except Exception as e:
             print(f"Error generating mutual fund recommendations: {e}")
             return self._get_fallback_mf_recommendations(recommendation_type)
+
+    def get_top_mf_recommendations_both(self):
+        """Generate the BUY and SELL top-5 mutual fund lists from a single scan"""
+        try:
+            return self._get_smart_mf_recommendations_both()
+
+        except Exception as e:
+            print(f"Error generating mutual fund recommendations: {e}")
+            return {rec_type: self._get_fallback_mf_recommendations(rec_type)
+                    for rec_type in ("BUY", "SELL")}
     
-    def _prepare_stock_analysis_data(self, symbol, stock_data, news_sentiment, company_info):
-        """Prepare stock data for AI analysis"""
-        recent_close = stock_data['Close'].iloc[-1]
-        month_ago_close = stock_data['Close'].iloc[-20] if len(stock_data) >= 20 else stock_data['Close'].iloc[0]
-        performance_1m = ((recent_close - month_ago_close) / month_ago_close) * 100
-        
-        volatility = stock_data['Close'].pct_change().std() * np.sqrt(252) * 100
-        
-        performance_summary = {
-            'current_price': recent_close,
-            '1m_return': performance_1m,
-            'volatility': volatility,
-            'volume_trend': 'increasing' if stock_data['Volume'].iloc[-5:].mean() > stock_data['Volume'].iloc[-10:-5].mean() else 'decreasing'
-        }
-        
-        # Technical indicators
-        sma_20 = stock_data['Close'].rolling(20).mean().iloc[-1]
-        sma_50 = stock_data['Close'].rolling(50).mean().iloc[-1] if len(stock_data) >= 50 else sma_20
-        
-        technical_summary = {
-            'sma_20': sma_20,
-            'sma_50': sma_50,
-            'price_vs_sma20': 'above' if recent_close > sma_20 else 'below',
-            'price_vs_sma50': 'above' if recent_close > sma_50 else 'below'
-        }
-        
-        news_summary = {
-            'sentiment_score': news_sentiment.get('sentiment_score', 0.5) if news_sentiment else 0.5,
-            'news_available': bool(news_sentiment)
-        }
-        
-        return {
-            'performance_summary': performance_summary,
-            'technical_summary': technical_summary,
-            'news_summary': news_summary
-        }
-    
-    def _prepare_fund_analysis_data(self, symbol, fund_data, fund_info):
-        """Prepare mutual fund data for AI analysis"""
-        recent_nav = fund_data['Close'].iloc[-1]
-        year_ago_nav = fund_data['Close'].iloc[0]
-        annual_return = ((recent_nav - year_ago_nav) / year_ago_nav) * 100
-        
-        volatility = fund_data['Close'].pct_change().std() * np.sqrt(252) * 100
-        
-        performance_summary = {
-            'current_nav': recent_nav,
-            'annual_return': annual_return,
-            'expense_ratio': fund_info.get('annualReportExpenseRatio', 0) * 100 if fund_info.get('annualReportExpenseRatio') else 'N/A',
-            'total_assets': fund_info.get('totalAssets', 0)
-        }
-        
-        risk_summary = {
-            'volatility': volatility,
-            'category': fund_info.get('category', 'Unknown')
-        }
-        
-        return {
-            'performance_summary': performance_summary,
-            'risk_summary': risk_summary
-        }
-    
+    def _compute_stock_features(self, close, volume):
+        """Shared numpy feature set consumed by the stock analysis paths.
+
+        Computed once per analysis from raw close/volume arrays so the
+        preparation and scoring paths never re-derive the same indicator.
+        The heavy lifting happens in the compiled single-pass kernel.
+        """
+        return StockFeatures(*stock_features(
+            np.ascontiguousarray(close, dtype=np.float64),
+            np.ascontiguousarray(volume, dtype=np.float64)))
+
+    def _update_stream(self, symbol, close, volume, last_ts):
+        """Stock features with per-symbol incremental window updates.
+
+        When exactly one new bar was appended since the previous call the
+        running window sums are updated in O(1) — add the new bar's
+        contribution, drop the one leaving each window — instead of
+        re-streaming the whole series. Cold starts, gaps, and history
+        rewrites fall back to the full kernel and reseed the state.
+        """
+        n = len(close)
+        state = self._streams.get(symbol) if last_ts is not None else None
+        if (state is not None and n == state['n'] + 1
+                and last_ts > state['last_ts']
+                and float(close[-2]) == state['last_close']):
+            tail = state['close_tail']
+            new = float(close[-1])
+            prev = state['last_close']
+
+            # Window sums: newest value in, oldest value out
+            state['sum20'] += new - tail[-20]
+            state['sum50'] += new - tail[-50]
+
+            delta = new - prev
+            old_delta = tail[-14] - tail[-15]
+            if delta > 0:
+                state['gain_sum'] += delta
+            else:
+                state['loss_sum'] -= delta
+            if old_delta > 0:
+                state['gain_sum'] -= old_delta
+            else:
+                state['loss_sum'] += old_delta
+
+            r = new / prev - 1.0
+            state['ret_sum'] += r
+            state['ret_sumsq'] += r * r
+
+            vtail = state['vol_tail']
+            vnew = float(volume[-1])
+            state['vsum20'] += vnew - vtail[-20]
+            state['vsum5'] += vnew - vtail[-5]
+
+            state['n'] = n
+            state['last_ts'] = last_ts
+            state['last_close'] = new
+            state['close_tail'] = close[-51:].astype(np.float64)
+            state['vol_tail'] = volume[-20:].astype(np.float64)
+
+            m = n - 1
+            var = (state['ret_sumsq'] - state['ret_sum'] ** 2 / m) / (m - 1)
+            vol_ann = np.sqrt(var * 252) * 100 if var > 0 else 0.0
+            gain_sum, loss_sum = state['gain_sum'], state['loss_sum']
+            rsi14 = 100 - 100 / (1 + gain_sum / loss_sum) if loss_sum > 0 else 100.0
+            avg_volume = state['vsum20'] / 20
+            vol_ratio = (state['vsum5'] / 5) / avg_volume if avg_volume > 0 else 1.0
+
+            return StockFeatures(
+                current=new,
+                sma20=state['sum20'] / 20,
+                sma50=state['sum50'] / 50,
+                rsi14=rsi14,
+                vol_ann=vol_ann,
+                vol_ratio=vol_ratio,
+                month_return=(new / float(close[-20]) - 1) * 100)
+
+        features = self._compute_stock_features(close, volume)
+        if last_ts is not None and n > 51:
+            deltas = np.diff(close[-15:])
+            returns = close[1:] / close[:-1] - 1.0
+            self._streams[symbol] = {
+                'n': n,
+                'last_ts': last_ts,
+                'last_close': float(close[-1]),
+                'close_tail': close[-51:].astype(np.float64),
+                'vol_tail': volume[-20:].astype(np.float64),
+                'sum20': float(close[-20:].sum()),
+                'sum50': float(close[-50:].sum()),
+                'gain_sum': float(np.maximum(deltas, 0).sum()),
+                'loss_sum': float(np.maximum(-deltas, 0).sum()),
+                'ret_sum': float(returns.sum()),
+                'ret_sumsq': float((returns * returns).sum()),
+                'vsum20': float(volume[-20:].sum()),
+                'vsum5': float(volume[-5:].sum())
+            }
+        return features
+
     def _get_advanced_stock_analysis(self, symbol, stock_data, news_sentiment, company_info):
         """Advanced rule-based stock analysis"""
-        current_price = stock_data['Close'].iloc[-1]
-        
-        # Technical analysis
-        returns = stock_data['Close'].pct_change()
-        volatility = returns.std() * np.sqrt(252) * 100
-        
-        # Price momentum (20-day vs 50-day SMA)
-        sma_20 = stock_data['Close'].rolling(20).mean().iloc[-1] if len(stock_data) >= 20 else current_price
-        sma_50 = stock_data['Close'].rolling(50).mean().iloc[-1] if len(stock_data) >= 50 else current_price
-        
-        # RSI calculation
-        delta = stock_data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs)).iloc[-1] if len(stock_data) >= 14 else 50
-        
-        # Volume analysis
-        avg_volume = stock_data['Volume'].rolling(20).mean().iloc[-1]
-        recent_volume = stock_data['Volume'].iloc[-5:].mean()
-        volume_trend = recent_volume / avg_volume if avg_volume > 0 else 1
+        # Under 20 bars none of the windowed indicators are meaningful;
+        # skip the numeric work entirely for IPO-fresh or thin histories
+        if len(stock_data) < 20:
+            return self._get_fallback_stock_analysis(symbol, stock_data)
+
+        # One ndarray conversion feeds the shared feature helper; the rest
+        # of this method only consumes scalars
+        close = stock_data['Close'].to_numpy()
+        volume = stock_data['Volume'].to_numpy()
+        try:
+            last_ts = int(stock_data.index[-1].value)
+        except (AttributeError, TypeError):
+            last_ts = None
+        features = self._update_stream(symbol, close, volume, last_ts)
+
+        current_price = features.current
+        volatility = features.vol_ann
+        sma_20 = features.sma20
+        sma_50 = features.sma50
+        rsi = features.rsi14
+        volume_trend = features.vol_ratio
         
         # News sentiment score
         sentiment_score = news_sentiment.get('sentiment_score', 0.5) if news_sentiment else 0.5
         
         # Market cap analysis
         market_cap = company_info.get('marketCap', 0)
-        pe_ratio = company_info.get('trailingPE', 20)
+        # Normalize to a float with a NaN sentinel for missing/zero values,
+        # so the scoring branches below compare once instead of re-testing
+        # truthiness at every use
+        pe_ratio = float(company_info.get('trailingPE', 20) or float('nan'))
         
         # Calculate scores
         technical_score = 0
@@ -170,12 +439,11 @@ class AIPredictor:
             technical_score -= 0.5  # Low volume, weak confirmation
             
         # Fundamental scoring
-        if pe_ratio and 10 <= pe_ratio <= 25:
-            fundamental_score += 1  # Reasonable valuation
-        elif pe_ratio and pe_ratio < 10:
-            fundamental_score += 2  # Potentially undervalued
-        elif pe_ratio and pe_ratio > 30:
-            fundamental_score -= 1  # Potentially overvalued
+        if not math.isnan(pe_ratio):
+            # +2 undervalued, +1 reasonable, -1 overvalued, 0 in between
+            fundamental_score += (2 if pe_ratio < 10 else
+                                  1 if pe_ratio <= 25 else
+                                  -1 if pe_ratio > 30 else 0)
             
         # Size factor
         if market_cap > 200e9:  # Large cap
@@ -210,62 +478,49 @@ class AIPredictor:
             confidence = 0.60 + abs(total_score) * 0.05
             target_multiplier = 1.03 if total_score > 0 else 0.97
         
-        # Generate reasoning
-        reasoning_parts = []
+        # Generate reasoning from the static sentence table
+        mask = 0
         if current_price > sma_20 and current_price > sma_50:
-            reasoning_parts.append("Strong technical uptrend with price above key moving averages")
+            mask |= 1
         elif current_price < sma_20 and current_price < sma_50:
-            reasoning_parts.append("Technical downtrend with price below moving averages")
+            mask |= 2
         else:
-            reasoning_parts.append("Mixed technical signals with consolidation pattern")
-            
+            mask |= 4
         if rsi < 30:
-            reasoning_parts.append("RSI indicates oversold conditions, potential buying opportunity")
+            mask |= 8
         elif rsi > 70:
-            reasoning_parts.append("RSI shows overbought levels, caution advised")
-            
+            mask |= 16
         if sentiment_score > 0.6:
-            reasoning_parts.append("Positive news sentiment supports the outlook")
+            mask |= 32
         elif sentiment_score < 0.4:
-            reasoning_parts.append("Negative news sentiment creates headwinds")
-            
-        if pe_ratio and pe_ratio < 15:
-            reasoning_parts.append("Attractive valuation with low P/E ratio")
-        elif pe_ratio and pe_ratio > 25:
-            reasoning_parts.append("Premium valuation requires strong growth to justify")
-            
-        reasoning = ". ".join(reasoning_parts) + "."
-        
+            mask |= 64
+        if pe_ratio < 15:
+            mask |= 128
+        elif pe_ratio > 25:
+            mask |= 256
+        reasoning = ". ".join(_select(_STOCK_REASONS, mask)) + "."
+
         # Risk factors
-        risk_factors = []
-        if volatility > 30:
-            risk_factors.append("High volatility increases investment risk")
-        if pe_ratio and pe_ratio > 30:
-            risk_factors.append("High valuation multiples vulnerable to market corrections")
-        if sentiment_score < 0.4:
-            risk_factors.append("Negative sentiment could impact near-term performance")
-        if market_cap < 2e9:
-            risk_factors.append("Small-cap stock subject to higher volatility")
-        if not risk_factors:
-            risk_factors = ["Market volatility", "Economic conditions"]
-            
+        mask = ((volatility > 30)
+                | ((pe_ratio > 30) << 1)
+                | ((sentiment_score < 0.4) << 2)
+                | ((market_cap < 2e9) << 3))
+        risk_factors = _select(_STOCK_RISKS, mask) or ["Market volatility", "Economic conditions"]
+
         # Key factors
-        key_factors = []
-        if volume_trend > 1.2:
-            key_factors.append("Strong volume confirms price action")
-        if current_price > sma_20:
-            key_factors.append("Positive momentum above 20-day average")
-        if sentiment_score > 0.6:
-            key_factors.append("Favorable news coverage")
-        if pe_ratio and pe_ratio < 20:
-            key_factors.append("Reasonable valuation metrics")
-        if not key_factors:
-            key_factors = ["Price momentum", "Market conditions"]
+        mask = ((volume_trend > 1.2)
+                | ((current_price > sma_20) << 1)
+                | ((sentiment_score > 0.6) << 2)
+                | ((pe_ratio < 20) << 3))
+        key_factors = _select(_STOCK_KEY_FACTORS, mask) or ["Price momentum", "Market conditions"]
         
+        # Plain Python floats at the boundary: numpy scalars in the result
+        # dict would drag every downstream serialization through the
+        # numpy.generic protocol
         return {
             'recommendation': recommendation,
-            'target_price': current_price * target_multiplier,
-            'confidence': confidence,
+            'target_price': float(current_price * target_multiplier),
+            'confidence': float(confidence),
             'reasoning': reasoning,
             'risk_factors': risk_factors,
             'time_horizon': 'medium term',
@@ -274,8 +529,8 @@ class AIPredictor:
 
     def _get_fallback_stock_analysis(self, symbol, stock_data):
         """Fallback analysis when AI fails"""
-        current_price = stock_data['Close'].iloc[-1]
-        
+        current_price = float(stock_data['Close'].iloc[-1])
+
         return {
             'recommendation': 'HOLD',
             'target_price': current_price * 1.05,
@@ -288,16 +543,11 @@ class AIPredictor:
     
     def _get_advanced_fund_analysis(self, symbol, fund_data, fund_info):
         """Advanced rule-based mutual fund analysis"""
-        current_nav = fund_data['Close'].iloc[-1]
-        
-        # Performance analysis
-        returns = fund_data['Close'].pct_change()
-        annual_return = returns.mean() * 252 * 100
-        volatility = returns.std() * np.sqrt(252) * 100
-        
-        # Sharpe ratio calculation
-        risk_free_rate = 2.0  # Assume 2% risk-free rate
-        sharpe_ratio = (annual_return - risk_free_rate) / volatility if volatility > 0 else 0
+        close = np.ascontiguousarray(fund_data['Close'].to_numpy(), dtype=np.float64)
+
+        # Performance, volatility, and Sharpe (2% risk-free rate) from one
+        # pass over the NAV series in the compiled kernel
+        current_nav, annual_return, volatility, sharpe_ratio = fund_features(close)
         
         # Expense ratio analysis
         expense_ratio = fund_info.get('annualReportExpenseRatio', 0.01) * 100
@@ -305,13 +555,12 @@ class AIPredictor:
         # Asset size analysis
         total_assets = fund_info.get('totalAssets', 0)
         
-        # Performance periods
-        periods = [21, 63, 252]  # 1M, 3M, 1Y
-        period_returns = {}
-        for period in periods:
-            if len(fund_data) >= period:
-                period_return = ((fund_data['Close'].iloc[-1] / fund_data['Close'].iloc[-period]) - 1) * 100
-                period_returns[f'{period}d'] = period_return
+        # Performance periods: one gather over the NAV array instead of a
+        # per-period loop
+        periods = _PERIOD_LENGTHS[_PERIOD_LENGTHS <= len(close)]
+        period_returns = dict(zip(
+            (f'{p}d' for p in periods),
+            (close[-1] / close[-periods] - 1) * 100))
         
         # Scoring system
         performance_score = 0
@@ -410,50 +659,33 @@ class AIPredictor:
             
         reasoning = ". ".join(reasoning_parts) + "."
         
-        # Fund strengths
-        strengths = []
-        if sharpe_ratio > 1.0:
-            strengths.append("Strong risk-adjusted returns")
-        if expense_ratio < 0.75:
-            strengths.append("Low cost structure")
-        if total_assets > 1e9:
-            strengths.append("Large asset base provides stability")
-        if volatility < 15:
-            strengths.append("Low volatility provides stability")
-        if annual_return > 8:
-            strengths.append("Consistent performance track record")
-        if not strengths:
-            strengths = ["Professional management", "Diversification"]
-            
-        # Fund weaknesses
-        weaknesses = []
-        if expense_ratio > 1.5:
-            weaknesses.append("High expense ratio reduces returns")
-        if volatility > 20:
-            weaknesses.append("High volatility increases risk")
-        if annual_return < 5:
-            weaknesses.append("Below-average performance")
-        if sharpe_ratio < 0.5:
-            weaknesses.append("Poor risk-adjusted returns")
-        if total_assets < 100e6:
-            weaknesses.append("Small asset base may limit liquidity")
-        if not weaknesses:
-            weaknesses = ["Market dependency", "Interest rate sensitivity"]
-            
-        # Risk factors
-        risk_factors = []
-        if volatility > 20:
-            risk_factors.append("High volatility may result in significant losses")
-        if expense_ratio > 1.5:
-            risk_factors.append("High fees erode long-term returns")
-        if '21d' in period_returns and period_returns['21d'] < -10:
-            risk_factors.append("Recent poor performance indicates potential issues")
-        risk_factors.extend(["Market risk", "Interest rate risk", "Manager risk"])
+        # Strengths, weaknesses, and risks from the static sentence tables,
+        # selected by one bitmask each instead of append chains
+        mask = ((sharpe_ratio > 1.0)
+                | ((expense_ratio < 0.75) << 1)
+                | ((total_assets > 1e9) << 2)
+                | ((volatility < 15) << 3)
+                | ((annual_return > 8) << 4))
+        strengths = _select(_FUND_STRENGTHS, mask) or ["Professional management", "Diversification"]
+
+        mask = ((expense_ratio > 1.5)
+                | ((volatility > 20) << 1)
+                | ((annual_return < 5) << 2)
+                | ((sharpe_ratio < 0.5) << 3)
+                | ((total_assets < 100e6) << 4))
+        weaknesses = _select(_FUND_WEAKNESSES, mask) or ["Market dependency", "Interest rate sensitivity"]
+
+        month_return = period_returns.get('21d')
+        mask = ((volatility > 20)
+                | ((expense_ratio > 1.5) << 1)
+                | ((month_return is not None and month_return < -10) << 2))
+        risk_factors = _select(_FUND_RISKS, mask)
+        risk_factors.extend(("Market risk", "Interest rate risk", "Manager risk"))
         
         return {
             'recommendation': recommendation,
-            'target_price': current_nav * target_multiplier,
-            'confidence': confidence,
+            'target_price': float(current_nav * target_multiplier),
+            'confidence': float(confidence),
             'reasoning': reasoning,
             'risk_factors': risk_factors[:4],  # Limit to 4 risk factors
             'time_horizon': 'long term',
@@ -463,8 +695,8 @@ class AIPredictor:
 
     def _get_fallback_fund_analysis(self, symbol, fund_data):
         """Fallback analysis for mutual funds when AI fails"""
-        current_nav = fund_data['Close'].iloc[-1]
-        
+        current_nav = float(fund_data['Close'].iloc[-1])
+
         return {
             'recommendation': 'HOLD',
             'target_price': current_nav * 1.03,
@@ -478,44 +710,91 @@ class AIPredictor:
     
     def _get_fallback_stock_recommendations(self, recommendation_type):
         """Fallback Indian stock recommendations"""
-        stocks = [
-            {"symbol": "RELIANCE.NS", "name": "Reliance Industries Limited", "current_price": 2850.00, "target_price": 3000.00, "confidence": 0.75, "reasoning": "Strong refining and telecom business growth.", "price_change": 5.3, "sector": "Energy"},
-            {"symbol": "TCS.NS", "name": "Tata Consultancy Services Limited", "current_price": 3650.00, "target_price": 3850.00, "confidence": 0.80, "reasoning": "IT services leadership and digital transformation.", "price_change": 5.5, "sector": "Technology"},
-            {"symbol": "HDFCBANK.NS", "name": "HDFC Bank Limited", "current_price": 1720.00, "target_price": 1850.00, "confidence": 0.70, "reasoning": "Strong banking fundamentals and digital initiatives.", "price_change": 7.6, "sector": "Financial Services"},
-            {"symbol": "INFY.NS", "name": "Infosys Limited", "current_price": 1890.00, "target_price": 2000.00, "confidence": 0.65, "reasoning": "Strong IT consulting and automation services.", "price_change": 5.8, "sector": "Technology"},
-            {"symbol": "ITC.NS", "name": "ITC Limited", "current_price": 465.00, "target_price": 500.00, "confidence": 0.72, "reasoning": "Diversified FMCG portfolio and dividend yield.", "price_change": 7.5, "sector": "Consumer Goods"}
-        ]
-        
-        if recommendation_type == "SELL":
-            for stock in stocks:
-                stock["target_price"] = stock["current_price"] * 0.95
-                stock["price_change"] = -2.0
-                stock["reasoning"] = "Technical indicators suggest potential downside."
-        
-        return stocks
-    
+        table = _FALLBACK_STOCKS_SELL if recommendation_type == "SELL" else _FALLBACK_STOCKS_BUY
+        return [dict(stock) for stock in table]
+
     def _get_fallback_mf_recommendations(self, recommendation_type):
         """Fallback Indian mutual fund recommendations"""
-        funds = [
-            {"symbol": "SBI-BLUECHIP", "name": "SBI Bluechip Fund", "current_price": 85.50, "target_price": 89.00, "confidence": 0.75, "reasoning": "Strong large-cap portfolio with consistent performance.", "price_change": 4.1, "sector": "Large Cap"},
-            {"symbol": "HDFC-TOP100", "name": "HDFC Top 100 Fund", "current_price": 920.00, "target_price": 950.00, "confidence": 0.70, "reasoning": "Diversified blue-chip equity exposure.", "price_change": 3.3, "sector": "Large Cap"},
-            {"symbol": "ICICI-BLUECHIP", "name": "ICICI Prudential Bluechip Fund", "current_price": 65.40, "target_price": 68.00, "confidence": 0.65, "reasoning": "Well-managed large-cap fund with stable returns.", "price_change": 4.0, "sector": "Large Cap"},
-            {"symbol": "AXIS-BLUECHIP", "name": "Axis Bluechip Fund", "current_price": 52.80, "target_price": 55.00, "confidence": 0.68, "reasoning": "Quality large-cap stocks with growth potential.", "price_change": 4.2, "sector": "Large Cap"},
-            {"symbol": "MIRAE-LARGECAP", "name": "Mirae Asset Large Cap Fund", "current_price": 98.20, "target_price": 102.00, "confidence": 0.72, "reasoning": "Systematic large-cap investment approach.", "price_change": 3.9, "sector": "Large Cap"}
-        ]
-        
-        if recommendation_type == "SELL":
-            for fund in funds:
-                fund["target_price"] = fund["current_price"] * 0.97
-                fund["price_change"] = -1.5
-                fund["reasoning"] = "Consider rebalancing portfolio allocation."
-        
-        return funds
+        table = _FALLBACK_FUNDS_SELL if recommendation_type == "SELL" else _FALLBACK_FUNDS_BUY
+        return [dict(fund) for fund in table]
     
     def _get_smart_stock_recommendations(self, recommendation_type="BUY"):
         """Generate smart stock recommendations using market analysis"""
+        return self._get_smart_stock_recommendations_both()[recommendation_type]
+
+    def _score_stock(self, recommendation_type, momentum, month_return, volatility, volume_ratio, sector):
+        """Score one side (BUY or SELL) from precomputed stock metrics"""
+        score = 0
+
+        if recommendation_type == "BUY":
+            # Buy scoring
+            if momentum > 2:
+                score += 2
+            elif momentum > 0:
+                score += 1
+            elif momentum < -5:
+                score -= 2
+            elif momentum < -2:
+                score -= 1
+
+            if month_return > 5:
+                score += 1
+            elif month_return < -10:
+                score -= 2
+
+            if volatility < 25:
+                score += 1
+            elif volatility > 40:
+                score -= 1
+
+            if volume_ratio > 1.2:
+                score += 1
+
+            # Sector adjustments
+            if sector in ["Technology", "Healthcare"]:
+                score += 0.5
+
+        else:  # SELL scoring
+            if momentum < -5:
+                score += 2
+            elif momentum < -2:
+                score += 1
+            elif momentum > 5:
+                score -= 1
+
+            if month_return < -10:
+                score += 2
+            elif month_return > 10:
+                score -= 1
+
+            if volatility > 40:
+                score += 1
+
+        return score
+
+    def _fetch_stock_history(self, data_fetcher, symbol):
+        """Fetch one symbol's recent history for the recommendation scan.
+
+        Runs inside the recommendation thread pool; returns None on any
+        failure so one bad symbol never poisons the batch.
+        """
+        try:
+            stock_data = data_fetcher.get_stock_data(symbol, "3mo")
+            if stock_data is None or len(stock_data) < 30:
+                return None
+            return stock_data
+
+        except Exception:
+            return None
+
+    def _get_smart_stock_recommendations_both(self):
+        """Scan the stock universe once and score both BUY and SELL sides"""
+        cached = _load_recommendation_cache('stock')
+        if cached is not None:
+            return cached
+
         from utils.data_fetcher import DataFetcher
-        
+
         # Popular Indian stocks to analyze (NSE symbols)
         popular_stocks = [
             ("RELIANCE.NS", "Reliance Industries Limited", "Energy"),
@@ -541,114 +820,182 @@ class AIPredictor:
         ]
         
         data_fetcher = DataFetcher()
-        recommendations = []
-        
-        for symbol, name, sector in popular_stocks:
-            try:
-                # Get recent stock data
-                stock_data = data_fetcher.get_stock_data(symbol, "3mo")
-                if stock_data is None or len(stock_data) < 30:
-                    continue
-                    
-                company_info = data_fetcher.get_company_info(symbol)
-                current_price = stock_data['Close'].iloc[-1]
-                
-                # Quick analysis for scoring
-                returns = stock_data['Close'].pct_change()
-                volatility = returns.std() * np.sqrt(252) * 100
-                
-                # Price momentum
-                sma_20 = stock_data['Close'].rolling(20).mean().iloc[-1]
-                momentum = (current_price / sma_20 - 1) * 100
-                
-                # Recent performance (1 month)
-                month_return = ((current_price / stock_data['Close'].iloc[-21]) - 1) * 100 if len(stock_data) >= 21 else 0
-                
-                # Volume trend
-                avg_volume = stock_data['Volume'].rolling(20).mean().iloc[-1]
-                recent_volume = stock_data['Volume'].iloc[-5:].mean()
-                volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
-                
-                # Scoring
-                score = 0
-                
-                if recommendation_type == "BUY":
-                    # Buy scoring
-                    if momentum > 2:
-                        score += 2
-                    elif momentum > 0:
-                        score += 1
-                    elif momentum < -5:
-                        score -= 2
-                    elif momentum < -2:
-                        score -= 1
-                        
-                    if month_return > 5:
-                        score += 1
-                    elif month_return < -10:
-                        score -= 2
-                        
-                    if volatility < 25:
-                        score += 1
-                    elif volatility > 40:
-                        score -= 1
-                        
-                    if volume_ratio > 1.2:
-                        score += 1
-                        
-                    # Sector adjustments
-                    if sector in ["Technology", "Healthcare"]:
-                        score += 0.5
-                        
-                else:  # SELL scoring
-                    if momentum < -5:
-                        score += 2
-                    elif momentum < -2:
-                        score += 1
-                    elif momentum > 5:
-                        score -= 1
-                        
-                    if month_return < -10:
-                        score += 2
-                    elif month_return > 10:
-                        score -= 1
-                        
-                    if volatility > 40:
-                        score += 1
-                        
-                # Calculate target price and confidence
-                if recommendation_type == "BUY":
-                    target_multiplier = 1.05 + max(0, score) * 0.02
-                    confidence = min(0.85, 0.55 + max(0, score) * 0.05)
-                    reasoning_base = "Strong technical momentum and fundamentals"
-                else:
-                    target_multiplier = 0.95 - max(0, score) * 0.02
-                    confidence = min(0.80, 0.55 + max(0, score) * 0.05)
-                    reasoning_base = "Technical indicators suggest downside risk"
-                
-                recommendations.append({
-                    'symbol': symbol,
-                    'name': name,
-                    'current_price': current_price,
-                    'target_price': current_price * target_multiplier,
-                    'confidence': confidence,
-                    'reasoning': f"{reasoning_base}. {momentum:+.1f}% vs 20-day average.",
-                    'price_change': (target_multiplier - 1) * 100,
-                    'sector': sector,
-                    'score': score
-                })
-                
-            except Exception as e:
+        recommendations = {"BUY": [], "SELL": []}
+
+        # The per-symbol fetches are independent network calls that dominate
+        # wall time, so fan the whole universe out to a thread pool, then
+        # score the results as one stacked batch
+        with ThreadPoolExecutor(max_workers=len(popular_stocks)) as executor:
+            frames = list(executor.map(
+                lambda item: self._fetch_stock_history(data_fetcher, item[0]),
+                popular_stocks))
+
+        metas, close_rows, volume_rows = [], [], []
+        for meta, data in zip(popular_stocks, frames):
+            if data is None:
                 continue
-        
-        # Sort by score and return top 5
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:5] if recommendations else self._get_fallback_stock_recommendations(recommendation_type)
+            metas.append(meta)
+            close_rows.append(data['Close'].to_numpy()[-63:])
+            volume_rows.append(data['Volume'].to_numpy()[-63:])
+
+        if metas:
+            # Histories can differ by a few sessions; align on the shortest
+            width = min(len(row) for row in close_rows)
+            close = np.vstack([row[-width:] for row in close_rows])
+            volume = np.vstack([row[-width:] for row in volume_rows])
+
+            # One vectorized pass over the (n_symbols, n_days) batch instead
+            # of per-symbol rolling chains
+            current = close[:, -1]
+            sma_20 = close[:, -20:].mean(axis=1)
+            momentum = (current / sma_20 - 1) * 100
+            month_return = (current / close[:, -21] - 1) * 100
+            returns = np.diff(close, axis=1) / close[:, :-1]
+            volatility = returns.std(axis=1, ddof=1) * _ANNUALIZER
+            avg_volume = volume[:, -20:].mean(axis=1)
+            recent_volume = volume[:, -5:].mean(axis=1)
+            safe_avg = np.where(avg_volume > 0, avg_volume, 1.0)
+            volume_ratio = np.where(avg_volume > 0, recent_volume / safe_avg, 1.0)
+
+            for i, (symbol, name, sector) in enumerate(metas):
+                # Score both sides from the same batch row
+                for recommendation_type in ("BUY", "SELL"):
+                    score = self._score_stock(recommendation_type, momentum[i], month_return[i],
+                                              volatility[i], volume_ratio[i], sector)
+
+                    # Calculate target price and confidence
+                    if recommendation_type == "BUY":
+                        target_multiplier = 1.05 + max(0, score) * 0.02
+                        confidence = min(0.85, 0.55 + max(0, score) * 0.05)
+                        reasoning_base = "Strong technical momentum and fundamentals"
+                    else:
+                        target_multiplier = 0.95 - max(0, score) * 0.02
+                        confidence = min(0.80, 0.55 + max(0, score) * 0.05)
+                        reasoning_base = "Technical indicators suggest downside risk"
+
+                    recommendations[recommendation_type].append({
+                        'symbol': symbol,
+                        'name': name,
+                        'current_price': float(current[i]),
+                        'target_price': float(current[i] * target_multiplier),
+                        'confidence': float(confidence),
+                        'reasoning': f"{reasoning_base}. {momentum[i]:+.1f}% vs 20-day average.",
+                        'price_change': (target_multiplier - 1) * 100,
+                        'sector': sector,
+                        'score': score
+                    })
+
+        # Keep the top 5 per side via a linear-time partial select
+        used_fallback = False
+        for recommendation_type, recs in recommendations.items():
+            if recs:
+                recommendations[recommendation_type] = _top_by_score(recs, 5)
+            else:
+                recommendations[recommendation_type] = self._get_fallback_stock_recommendations(recommendation_type)
+                used_fallback = True
+
+        # Fallback lists reflect fetch failures, not market state; only
+        # genuine scans are worth persisting
+        if not used_fallback:
+            _store_recommendation_cache('stock', recommendations)
+        return recommendations
     
     def _get_smart_mf_recommendations(self, recommendation_type="BUY"):
         """Generate smart mutual fund recommendations using market analysis"""
+        return self._get_smart_mf_recommendations_both()[recommendation_type]
+
+    def _score_mutual_fund(self, recommendation_type, annual_return, sharpe_ratio, expense_ratio, quarter_return, category):
+        """Score one side (BUY or SELL) from precomputed fund metrics"""
+        score = 0
+
+        if recommendation_type == "BUY":
+            # Buy scoring for funds
+            if annual_return > 10:
+                score += 2
+            elif annual_return > 6:
+                score += 1
+            elif annual_return < 2:
+                score -= 1
+            elif annual_return < 0:
+                score -= 2
+
+            if sharpe_ratio > 1.0:
+                score += 2
+            elif sharpe_ratio > 0.5:
+                score += 1
+            elif sharpe_ratio < 0:
+                score -= 1
+
+            if expense_ratio < 0.5:
+                score += 2
+            elif expense_ratio < 1.0:
+                score += 1
+            elif expense_ratio > 2.0:
+                score -= 2
+
+            if quarter_return > 3:
+                score += 1
+            elif quarter_return < -5:
+                score -= 1
+
+            # Category adjustments
+            if category in ["Large Blend", "Intermediate-Term Bond"]:
+                score += 0.5  # Stable categories
+
+        else:  # SELL scoring
+            if annual_return < 0:
+                score += 2
+            elif annual_return < 3:
+                score += 1
+            elif annual_return > 12:
+                score -= 1
+
+            if sharpe_ratio < 0:
+                score += 2
+            elif sharpe_ratio < 0.5:
+                score += 1
+
+            if expense_ratio > 2.0:
+                score += 1
+
+            if quarter_return < -8:
+                score += 2
+
+        return score
+
+    def _fetch_fund_history(self, data_fetcher, symbol):
+        """Six months of NAV history, extended incrementally when warm.
+
+        The first scan downloads the full window; later scans fetch only
+        the last few days, splice any genuinely new bars onto the cached
+        frame, and trim it back to ~126 trading days. Re-running the
+        stats over the spliced array stays exact, unlike approximate
+        online estimators, and the per-fund network cost drops to the
+        new bars alone.
+        """
+        cached = self._fund_history.get(symbol)
+        if cached is not None:
+            recent = data_fetcher.get_mutual_fund_data(symbol, "5d")
+            if recent is not None:
+                new_rows = recent[recent.index > cached.index[-1]]
+                if len(new_rows) > 0:
+                    cached = pd.concat([cached, new_rows]).tail(126)
+                    self._fund_history[symbol] = cached
+            return cached
+
+        fund_data = data_fetcher.get_mutual_fund_data(symbol, "6mo")
+        if fund_data is not None and len(fund_data) >= 50:
+            self._fund_history[symbol] = fund_data
+        return fund_data
+
+    def _get_smart_mf_recommendations_both(self):
+        """Scan the fund universe once and score both BUY and SELL sides"""
+        cached = _load_recommendation_cache('fund')
+        if cached is not None:
+            return cached
+
         from utils.data_fetcher import DataFetcher
-        
+
         # Popular Indian mutual funds to analyze (using representative stock symbols for analysis)
         popular_funds = [
             ("SBI-BLUECHIP", "SBI Bluechip Fund", "Large Cap"),
@@ -666,113 +1013,78 @@ class AIPredictor:
         ]
         
         data_fetcher = DataFetcher()
-        recommendations = []
-        
-        for symbol, name, category in popular_funds:
+        recommendations = {"BUY": [], "SELL": []}
+
+        def fetch(item):
+            """Blocking I/O for one fund; None on any failure"""
             try:
-                # Get recent fund data
-                fund_data = data_fetcher.get_mutual_fund_data(symbol, "6mo")
+                fund_data = self._fetch_fund_history(data_fetcher, item[0])
                 if fund_data is None or len(fund_data) < 50:
-                    continue
-                    
-                fund_info = data_fetcher.get_fund_info(symbol)
-                current_nav = fund_data['Close'].iloc[-1]
-                
-                # Performance analysis
-                returns = fund_data['Close'].pct_change()
-                annual_return = returns.mean() * 252 * 100
-                volatility = returns.std() * np.sqrt(252) * 100
-                
-                # Sharpe ratio
-                sharpe_ratio = (annual_return - 2) / volatility if volatility > 0 else 0
-                
+                    return None
+                return fund_data, data_fetcher.get_fund_info(item[0])
+            except Exception:
+                return None
+
+        # The per-fund cost is two blocking HTTP calls; overlap all of
+        # them so the scan takes ~one round-trip instead of twelve
+        with ThreadPoolExecutor(max_workers=len(popular_funds)) as executor:
+            fetched = list(executor.map(fetch, popular_funds))
+
+        for (symbol, name, category), result in zip(popular_funds, fetched):
+            if result is None:
+                continue
+            fund_data, fund_info = result
+            try:
+                # One ndarray conversion per fund; the single-pass kernel
+                # covers performance, volatility, and Sharpe
+                closes = np.ascontiguousarray(fund_data['Close'].to_numpy(), dtype=np.float64)
+                current_nav, annual_return, volatility, sharpe_ratio = fund_features(closes)
+
                 # Recent performance (3 months)
-                quarter_return = ((current_nav / fund_data['Close'].iloc[-63]) - 1) * 100 if len(fund_data) >= 63 else 0
-                
+                quarter_return = ((current_nav / closes[-63]) - 1) * 100 if len(closes) >= 63 else 0
+
                 # Expense ratio
                 expense_ratio = fund_info.get('annualReportExpenseRatio', 0.01) * 100
-                
-                # Scoring
-                score = 0
-                
-                if recommendation_type == "BUY":
-                    # Buy scoring for funds
-                    if annual_return > 10:
-                        score += 2
-                    elif annual_return > 6:
-                        score += 1
-                    elif annual_return < 2:
-                        score -= 1
-                    elif annual_return < 0:
-                        score -= 2
-                        
-                    if sharpe_ratio > 1.0:
-                        score += 2
-                    elif sharpe_ratio > 0.5:
-                        score += 1
-                    elif sharpe_ratio < 0:
-                        score -= 1
-                        
-                    if expense_ratio < 0.5:
-                        score += 2
-                    elif expense_ratio < 1.0:
-                        score += 1
-                    elif expense_ratio > 2.0:
-                        score -= 2
-                        
-                    if quarter_return > 3:
-                        score += 1
-                    elif quarter_return < -5:
-                        score -= 1
-                        
-                    # Category adjustments
-                    if category in ["Large Blend", "Intermediate-Term Bond"]:
-                        score += 0.5  # Stable categories
-                        
-                else:  # SELL scoring
-                    if annual_return < 0:
-                        score += 2
-                    elif annual_return < 3:
-                        score += 1
-                    elif annual_return > 12:
-                        score -= 1
-                        
-                    if sharpe_ratio < 0:
-                        score += 2
-                    elif sharpe_ratio < 0.5:
-                        score += 1
-                        
-                    if expense_ratio > 2.0:
-                        score += 1
-                        
-                    if quarter_return < -8:
-                        score += 2
-                
-                # Calculate target price and confidence
-                if recommendation_type == "BUY":
-                    target_multiplier = 1.03 + max(0, score) * 0.01
-                    confidence = min(0.85, 0.60 + max(0, score) * 0.04)
-                    reasoning_base = "Strong risk-adjusted returns with reasonable fees"
-                else:
-                    target_multiplier = 0.97 - max(0, score) * 0.01
-                    confidence = min(0.80, 0.60 + max(0, score) * 0.04)
-                    reasoning_base = "Underperforming with concerning risk metrics"
-                
-                recommendations.append({
-                    'symbol': symbol,
-                    'name': name,
-                    'current_price': current_nav,
-                    'target_price': current_nav * target_multiplier,
-                    'confidence': confidence,
-                    'reasoning': f"{reasoning_base}. {annual_return:.1f}% annual return, {expense_ratio:.2f}% fees.",
-                    'price_change': (target_multiplier - 1) * 100,
-                    'sector': category,
-                    'score': score
-                })
-                
+
+                # Score both sides from the same fetched metrics
+                for recommendation_type in ("BUY", "SELL"):
+                    score = self._score_mutual_fund(recommendation_type, annual_return, sharpe_ratio,
+                                                    expense_ratio, quarter_return, category)
+
+                    # Calculate target price and confidence
+                    if recommendation_type == "BUY":
+                        target_multiplier = 1.03 + max(0, score) * 0.01
+                        confidence = min(0.85, 0.60 + max(0, score) * 0.04)
+                        reasoning_base = "Strong risk-adjusted returns with reasonable fees"
+                    else:
+                        target_multiplier = 0.97 - max(0, score) * 0.01
+                        confidence = min(0.80, 0.60 + max(0, score) * 0.04)
+                        reasoning_base = "Underperforming with concerning risk metrics"
+
+                    recommendations[recommendation_type].append({
+                        'symbol': symbol,
+                        'name': name,
+                        'current_price': float(current_nav),
+                        'target_price': float(current_nav * target_multiplier),
+                        'confidence': float(confidence),
+                        'reasoning': f"{reasoning_base}. {annual_return:.1f}% annual return, {expense_ratio:.2f}% fees.",
+                        'price_change': (target_multiplier - 1) * 100,
+                        'sector': category,
+                        'score': score
+                    })
+
             except Exception as e:
                 continue
-        
-        # Sort by score and return top 5
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:5] if recommendations else self._get_fallback_mf_recommendations(recommendation_type)
+
+        # Keep the top 5 per side via a linear-time partial select
+        used_fallback = False
+        for recommendation_type, recs in recommendations.items():
+            if recs:
+                recommendations[recommendation_type] = _top_by_score(recs, 5)
+            else:
+                recommendations[recommendation_type] = self._get_fallback_mf_recommendations(recommendation_type)
+                used_fallback = True
+
+        if not used_fallback:
+            _store_recommendation_cache('fund', recommendations)
+        return recommendations
@@ -0,0 +1,68 @@
+import streamlit as st
+import pandas as pd
+from utils.data_fetcher import DataFetcher
+
+# Streamlit-cached wrappers around DataFetcher. Keeping these at module level
+# lets st.cache_data key results on the plain (symbol, period) arguments, so
+# reruns of the same analysis skip the Yahoo Finance round-trip entirely.
+
+@st.cache_data(ttl=3600)
+def get_stock_data(symbol, period="1y"):
+    """Fetch stock data, cached for an hour per (symbol, period)"""
+    return DataFetcher().get_stock_data(symbol, period)
+
+@st.cache_data(ttl=3600)
+def get_mutual_fund_data(symbol, period="1y"):
+    """Fetch mutual fund data, cached for an hour per (symbol, period)"""
+    return DataFetcher().get_mutual_fund_data(symbol, period)
+
+@st.cache_data(ttl=86400)
+def get_company_info(symbol):
+    """Company metadata changes rarely; cache for a day"""
+    return DataFetcher().get_company_info(symbol)
+
+@st.cache_data(ttl=86400)
+def get_fund_info(symbol):
+    """Fund metadata changes rarely; cache for a day"""
+    return DataFetcher().get_fund_info(symbol)
+
+@st.cache_data(ttl=600)
+def get_news_sentiment(symbol):
+    """News sentiment goes stale quickly; cache for 10 minutes"""
+    return DataFetcher().get_news_sentiment(symbol)
+
+# Derived computations are pure functions of the cached price data, so keying
+# them on (symbol, period) lets reruns skip the pandas work as well.
+
+@st.cache_data(ttl=3600)
+def calculate_technical_indicators(symbol, period="1y"):
+    """RSI/SMA/volatility for a symbol, cached per (symbol, period)"""
+    return DataFetcher().calculate_technical_indicators(get_stock_data(symbol, period))
+
+@st.cache_data(ttl=3600)
+def calculate_fund_performance(symbol, period="1y"):
+    """Return/Sharpe/drawdown for a fund, cached per (symbol, period)"""
+    return DataFetcher().calculate_fund_performance(get_mutual_fund_data(symbol, period))
+
+# Figure construction is pure given its inputs, so built charts are cached
+# too. Streamlit's default DataFrame hasher pickles the whole frame, so
+# cached functions taking price frames register a constant-cost content
+# hash instead: the shape plus a sample of the raw value bytes (head of the
+# block and the last row, which is what changes day to day).
+
+def _fast_df_hash(df):
+    """Constant-cost cache key for a price frame"""
+    values = df.to_numpy()
+    return repr(df.shape).encode() + values.tobytes()[:256] + values[-1:].tobytes()
+
+@st.cache_data(max_entries=32, hash_funcs={pd.DataFrame: _fast_df_hash})
+def create_stock_chart(symbol, stock_data):
+    """Built stock chart figure, cached per symbol and frame content"""
+    from utils.chart_creator import ChartCreator
+    return ChartCreator().create_stock_chart(stock_data, symbol)
+
+@st.cache_data(max_entries=32)
+def create_recommendation_gauge(confidence, recommendation):
+    """Confidence gauge figure, cached per (confidence, recommendation)"""
+    from utils.chart_creator import ChartCreator
+    return ChartCreator().create_recommendation_gauge(confidence, recommendation)
@@ -1,9 +1,23 @@
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils._kernels import rolling_rsi, sma_pair, smoothed_period_return
+
+# orjson serializes the multi-year figure payloads several times faster than
+# the stdlib encoder; fall back silently when it is not installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
 class ChartCreator:
+    # Trace color cycle for comparison charts, built once at class scope
+    # instead of a fresh list per call
+    _COMPARE_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#ff7f0e', '#17a2b8')
+
     def __init__(self):
         self.color_palette = {
             'primary': '#1f77b4',
@@ -18,6 +32,11 @@ class ChartCreator:
     
     def create_stock_chart(self, stock_data, symbol):
         """Create comprehensive stock chart with price, volume, and technical indicators"""
+        # Too few bars for any indicator row to hold data; skip the
+        # three-pane scaffolding and return a plain price line
+        if len(stock_data) < 20:
+            return self._simple_line_chart(stock_data, symbol)
+
         fig = make_subplots(
             rows=3, cols=1,
             shared_xaxes=True,
@@ -41,11 +60,12 @@ class ChartCreator:
             row=1, col=1
         )
         
-        # Moving averages
+        # Moving averages: both windows from a single compiled traversal
         if len(stock_data) >= 20:
-            sma_20 = stock_data['Close'].rolling(window=20).mean()
+            closes = np.ascontiguousarray(stock_data['Close'].to_numpy(), dtype=np.float64)
+            sma_20, sma_50 = sma_pair(closes, 20, 50)
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=stock_data.index,
                     y=sma_20,
                     mode='lines',
@@ -54,30 +74,43 @@ class ChartCreator:
                 ),
                 row=1, col=1
             )
+
+            if len(stock_data) >= 50:
+                fig.add_trace(
+                    go.Scattergl(
+                        x=stock_data.index,
+                        y=sma_50,
+                        mode='lines',
+                        name='SMA 50',
+                        line=dict(color=self.color_palette['secondary'], width=2)
+                    ),
+                    row=1, col=1
+                )
         
-        if len(stock_data) >= 50:
-            sma_50 = stock_data['Close'].rolling(window=50).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=stock_data.index,
-                    y=sma_50,
-                    mode='lines',
-                    name='SMA 50',
-                    line=dict(color=self.color_palette['secondary'], width=2)
-                ),
-                row=1, col=1
-            )
-        
-        # Volume chart
-        colors = ['red' if close < open else 'green' 
-                 for close, open in zip(stock_data['Close'], stock_data['Open'])]
-        
+        # Volume chart: two single-color traces split on the bar's sign,
+        # so no per-bar color array is built or serialized
+        volume = stock_data['Volume'].to_numpy()
+        up = stock_data['Close'].to_numpy() >= stock_data['Open'].to_numpy()
+
+        fig.add_trace(
+            go.Bar(
+                x=stock_data.index,
+                y=np.where(up, volume, 0),
+                name='Volume',
+                legendgroup='volume',
+                marker_color='green',
+                opacity=0.7
+            ),
+            row=2, col=1
+        )
         fig.add_trace(
             go.Bar(
                 x=stock_data.index,
-                y=stock_data['Volume'],
+                y=np.where(up, 0, volume),
                 name='Volume',
-                marker_color=colors,
+                legendgroup='volume',
+                showlegend=False,
+                marker_color='red',
                 opacity=0.7
             ),
             row=2, col=1
@@ -87,7 +120,7 @@ class ChartCreator:
         if len(stock_data) >= 14:
             rsi = self._calculate_rsi(stock_data['Close'])
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=stock_data.index,
                     y=rsi,
                     mode='lines',
@@ -129,7 +162,7 @@ class ChartCreator:
         
         # NAV chart
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=fund_data.index,
                 y=fund_data['Close'],
                 mode='lines',
@@ -140,11 +173,13 @@ class ChartCreator:
             row=1, col=1
         )
         
-        # Calculate and plot rolling returns
+        # Calculate and plot rolling returns: the 30-day percent change
+        # and its 30-window mean come from one fused pass
         if len(fund_data) >= 30:
-            rolling_returns = fund_data['Close'].pct_change(30).rolling(window=30).mean() * 100
+            closes = np.ascontiguousarray(fund_data['Close'].to_numpy(), dtype=np.float64)
+            rolling_returns = smoothed_period_return(closes, 30)
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=fund_data.index,
                     y=rolling_returns,
                     mode='lines',
@@ -175,17 +210,17 @@ class ChartCreator:
     def create_performance_comparison_chart(self, data_dict, title="Performance Comparison"):
         """Create performance comparison chart for multiple assets"""
         fig = go.Figure()
-        
-        colors = [self.color_palette['primary'], self.color_palette['secondary'], 
-                 self.color_palette['success'], self.color_palette['warning'],
-                 self.color_palette['info']]
-        
+
+        colors = self._COMPARE_COLORS
+
         for i, (name, data) in enumerate(data_dict.items()):
-            # Normalize to percentage change from start
-            normalized_data = (data / data.iloc[0] - 1) * 100
-            
+            # Normalize to percentage change from start on the raw array;
+            # WebGL rendering keeps multi-year traces off the SVG path
+            values = data.to_numpy()
+            normalized_data = (values / values[0] - 1) * 100
+
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=data.index,
                     y=normalized_data,
                     mode='lines',
@@ -249,15 +284,19 @@ class ChartCreator:
     
     def create_sentiment_chart(self, sentiment_data):
         """Create sentiment analysis visualization"""
-        if not sentiment_data or not sentiment_data.get('article_sentiments'):
+        if not sentiment_data:
             return None
-        
-        articles = sentiment_data['article_sentiments']
-        dates = [article['publishedAt'][:10] for article in articles]  # Extract date
-        sentiments = [article['polarity'] for article in articles]
-        
+        articles = sentiment_data.get('article_sentiments')
+        if articles is None or len(articles) == 0:
+            return None
+
+        # Column pulls from the sentiment frame, no per-article dicts
+        dates = articles['publishedAt'].str[:10]  # Extract date
+        sentiments = articles['polarity'].to_numpy()
+
         # Create colors based on sentiment
-        colors = ['green' if s > 0.1 else 'red' if s < -0.1 else 'gray' for s in sentiments]
+        colors = np.where(sentiments > 0.1, 'green',
+                          np.where(sentiments < -0.1, 'red', 'gray'))
         
         fig = go.Figure()
         
@@ -292,11 +331,29 @@ class ChartCreator:
         
         return fig
     
+    def _simple_line_chart(self, stock_data, symbol):
+        """Single-pane close-price chart for series too short for indicators"""
+        fig = go.Figure(
+            go.Scattergl(
+                x=stock_data.index,
+                y=stock_data['Close'],
+                mode='lines',
+                name='Price',
+                line=dict(color=self.color_palette['primary'], width=2)
+            )
+        )
+        fig.update_layout(
+            title=f'{symbol} Stock Price',
+            xaxis_title="Date",
+            yaxis_title="Price (₹)",
+            height=500,
+            template='plotly_white'
+        )
+        return fig
+
     def _calculate_rsi(self, prices, window=14):
         """Calculate RSI (Relative Strength Index)"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        # One compiled pass over the raw array instead of four rolling
+        # Series allocations; the chart consumes the ndarray directly
+        closes = np.ascontiguousarray(prices.to_numpy(), dtype=np.float64)
+        return rolling_rsi(closes, window)
@@ -1,55 +1,243 @@
-import yfinance as yf
+# yfinance-cache is a drop-in replacement that persists price history on
+# disk and fetches only the missing tail on refresh; fall back to plain
+# yfinance when it is not installed
+try:
+    import yfinance_cache as yf
+except ImportError:
+    import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import requests
 import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from textblob import TextBlob
 import time
+from utils._njit import njit
+from utils._kernels import ret_stats, max_drawdown
+
+# TA-Lib's C implementations are the fastest option for the standard
+# indicators, but the package needs a native library that is not always
+# available; the compiled loops below cover the same math otherwise.
+try:
+    import talib
+except ImportError:
+    talib = None
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _rsi_loop(closes, window):
+    """RSI over the close series via sliding gain/loss sums"""
+    n = closes.shape[0]
+    rsi = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, n):
+        delta = closes[i] - closes[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        else:
+            loss_sum -= delta
+        if i > window:
+            old = closes[i - window] - closes[i - window - 1]
+            if old > 0:
+                gain_sum -= old
+            else:
+                loss_sum += old
+        if i >= window:
+            if loss_sum > 0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0:
+                rsi[i] = 100.0
+    return rsi
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _sma_loop(closes, window):
+    """Simple moving average via a sliding window sum"""
+    n = closes.shape[0]
+    sma = np.full(n, np.nan)
+    window_sum = 0.0
+    for i in range(n):
+        window_sum += closes[i]
+        if i >= window:
+            window_sum -= closes[i - window]
+        if i >= window - 1:
+            sma[i] = window_sum / window
+    return sma
+
+# Back direct HTTP calls (NewsAPI) with an on-disk TTL cache when
+# requests_cache is installed, so repeated lookups skip the round-trip.
+# yfinance rejects caching sessions (it manages its own cache), so the
+# cached session is only used for non-yfinance requests.
+try:
+    import requests_cache
+    _http_session = requests_cache.CachedSession('.http_cache', expire_after=3600)
+except ImportError:
+    _http_session = requests.Session()
+
+# Ticker objects carry internal state and HTTP session setup, so build each
+# one once per process and reuse it across reruns and DataFetcher instances.
+_ticker_cache = {}
+
+# Annualization factor and risk-free rate, computed once at import
+_SQRT252 = float(np.sqrt(252))
+_RISK_FREE_RATE = 0.02
+
+# On-disk TTL memoization for Yahoo fetches: repeated UI refreshes reload
+# identical bars, so warm calls become a pickle read instead of a network
+# round-trip. File mtime doubles as the expiry clock. Price history stays
+# fresh within 15 minutes; company/fund profiles barely change intra-day.
+_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'investanalyze_yf_cache')
+_HISTORY_TTL = 900
+_INFO_TTL = 86400
+
+# Negative cache: symbols Yahoo returns no bars for (delisted or simply
+# not valid Yahoo tickers) fail identically on every scan, so remember
+# them for a day and skip the round-trip. Only an empty-but-successful
+# response lands here — transient fetch errors are never recorded.
+_BAD_SYMBOL_TTL = 86400
+
+def _disk_cache_get(name, ttl):
+    """Cached value for name if younger than ttl seconds, else None"""
+    path = os.path.join(_DISK_CACHE_DIR, name + '.pkl')
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as fh:
+                return pickle.load(fh)
+    except (OSError, EOFError, pickle.PickleError):
+        pass
+    return None
+
+def _disk_cache_put(name, value):
+    """Persist value under name, atomically so readers never see partials"""
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        path = os.path.join(_DISK_CACHE_DIR, name + '.pkl')
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error writing disk cache: {e}")
+
+def _cache_name(kind, symbol, period=None):
+    """Filesystem-safe cache file name for a fetch"""
+    raw = f"{kind}_{symbol}_{period}" if period else f"{kind}_{symbol}"
+    return "".join(c if c.isalnum() or c in '._-' else '-' for c in raw)
+
+def get_ticker(symbol):
+    """Return a memoized yf.Ticker for the symbol"""
+    return _ticker_cache.setdefault(symbol, yf.Ticker(symbol))
+
+def _downcast_ohlcv(data):
+    """Downcast price columns to float32 in place and return the frame.
+
+    Quotes carry fewer than seven significant digits, so float32 loses
+    nothing visible while halving the bytes every rolling window and
+    chart serialization pulls through. Volume stays floating point
+    because heavy index days overflow int32. Kernels that accumulate
+    returns still widen to float64 at their call sites.
+    """
+    for column in ('Open', 'High', 'Low', 'Close', 'Volume'):
+        if column in data.columns:
+            data[column] = data[column].astype(np.float32, copy=False)
+    return data
+
+# VADER scores headlines from a lexicon in one pass, orders of magnitude
+# faster than TextBlob's per-call POS tagging; keep TextBlob as the
+# fallback scorer when vaderSentiment is not installed.
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    _vader = SentimentIntensityAnalyzer()
+except ImportError:
+    _vader = None
+
+# News feeds repeat the same headlines across refreshes and near-duplicate
+# articles within one; memoize the polarity per text instead of
+# re-analyzing duplicates.
+@lru_cache(maxsize=4096)
+def _polarity(text):
+    """Memoized sentiment polarity in [-1, 1] for an article text"""
+    if _vader is not None:
+        return _vader.polarity_scores(text)['compound']
+    return TextBlob(text).sentiment.polarity
 
 class DataFetcher:
     def __init__(self):
         self.news_api_key = os.getenv("NEWS_API_KEY", "")
-        
+        self.session = _http_session
+
     def get_stock_data(self, symbol, period="1y"):
         """Fetch stock data from Yahoo Finance"""
+        name = _cache_name('history', symbol, period)
+        data = _disk_cache_get(name, _HISTORY_TTL)
+        if data is not None:
+            return data
+        if _disk_cache_get(_cache_name('bad', symbol), _BAD_SYMBOL_TTL):
+            return None
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             data = ticker.history(period=period)
-            if data.empty:
+            if len(data) == 0:
+                _disk_cache_put(_cache_name('bad', symbol), True)
                 return None
+            data = _downcast_ohlcv(data)
+            _disk_cache_put(name, data)
             return data
         except Exception as e:
             print(f"Error fetching stock data for {symbol}: {e}")
             return None
-    
+
     def get_mutual_fund_data(self, symbol, period="1y"):
         """Fetch mutual fund data from Yahoo Finance"""
+        name = _cache_name('history', symbol, period)
+        data = _disk_cache_get(name, _HISTORY_TTL)
+        if data is not None:
+            return data
+        if _disk_cache_get(_cache_name('bad', symbol), _BAD_SYMBOL_TTL):
+            return None
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             data = ticker.history(period=period)
-            if data.empty:
+            if len(data) == 0:
+                _disk_cache_put(_cache_name('bad', symbol), True)
                 return None
+            data = _downcast_ohlcv(data)
+            _disk_cache_put(name, data)
             return data
         except Exception as e:
             print(f"Error fetching mutual fund data for {symbol}: {e}")
             return None
-    
+
     def get_company_info(self, symbol):
         """Get company information"""
+        name = _cache_name('info', symbol)
+        info = _disk_cache_get(name, _INFO_TTL)
+        if info is not None:
+            return info
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             info = ticker.info
+            if info:
+                _disk_cache_put(name, info)
             return info
         except Exception as e:
             print(f"Error fetching company info for {symbol}: {e}")
             return {}
-    
+
     def get_fund_info(self, symbol):
         """Get mutual fund information"""
+        name = _cache_name('info', symbol)
+        info = _disk_cache_get(name, _INFO_TTL)
+        if info is not None:
+            return info
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             info = ticker.info
+            if info:
+                _disk_cache_put(name, info)
             return info
         except Exception as e:
             print(f"Error fetching fund info for {symbol}: {e}")
@@ -76,7 +264,7 @@ class DataFetcher:
                 'apiKey': self.news_api_key
             }
             
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             if response.status_code == 200:
                 news_data = response.json()
                 articles = news_data.get('articles', [])
@@ -88,8 +276,7 @@ class DataFetcher:
                 sentiments = []
                 for article in articles:
                     text = f"{article.get('title', '')} {article.get('description', '')}"
-                    blob = TextBlob(text)
-                    sentiments.append(blob.sentiment.polarity)
+                    sentiments.append(_polarity(text))
                 
                 avg_sentiment = np.mean(sentiments)
                 # Convert from [-1, 1] to [0, 1]
@@ -109,28 +296,38 @@ class DataFetcher:
     def calculate_technical_indicators(self, data):
         """Calculate technical indicators"""
         try:
-            close_prices = data['Close']
-            
-            # RSI
-            delta = close_prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            # Moving averages
-            sma_20 = close_prices.rolling(window=20).mean()
-            sma_50 = close_prices.rolling(window=50).mean()
-            
+            # Single ndarray conversion; the compiled loops replace the
+            # chain of rolling-window Series allocations. copy=True keeps
+            # the array writable, which the eager kernel signatures require.
+            closes = data['Close'].to_numpy(dtype=np.float64, copy=True)
+
+            # Only the latest value of each indicator is consumed, so hand
+            # the kernels just the trailing window instead of the full
+            # series: O(window) work regardless of the analysis period
+            if talib is not None:
+                # Wilder RSI converges within ~4x the period, so 128 bars
+                # is enough history for the last value
+                rsi = talib.RSI(closes[-128:], timeperiod=14)[-1]
+                sma_20 = talib.SMA(closes[-20:], timeperiod=20)[-1]
+                sma_50 = talib.SMA(closes[-50:], timeperiod=50)[-1]
+            else:
+                # The rolling-mean RSI's last value depends on exactly the
+                # trailing 14 deltas, so this slice is lossless
+                rsi = _rsi_loop(closes[-15:], 14)[-1]
+                sma_20 = _sma_loop(closes[-20:], 20)[-1]
+                sma_50 = _sma_loop(closes[-50:], 50)[-1]
+
             # Volatility (annualized)
-            returns = close_prices.pct_change().dropna()
-            volatility = returns.std() * np.sqrt(252) * 100
-            
+            returns = closes[1:] / closes[:-1] - 1.0
+            volatility = returns.std(ddof=1) * _SQRT252 * 100
+
+            # Hand back plain Python floats so consumers never carry
+            # numpy scalars into formatting or serialization
             return {
-                'rsi': rsi.iloc[-1],
-                'sma_20': sma_20.iloc[-1],
-                'sma_50': sma_50.iloc[-1],
-                'volatility': volatility
+                'rsi': float(rsi),
+                'sma_20': float(sma_20),
+                'sma_50': float(sma_50),
+                'volatility': float(volatility)
             }
         except Exception as e:
             print(f"Error calculating technical indicators: {e}")
@@ -144,26 +341,25 @@ class DataFetcher:
     def calculate_fund_performance(self, data):
         """Calculate mutual fund performance metrics"""
         try:
-            close_prices = data['Close']
-            returns = close_prices.pct_change().dropna()
-            
+            # Mean and std of daily returns come from one compiled pass
+            # with no intermediate return arrays
+            closes = data['Close'].to_numpy()
+            mean_ret, std_ret = ret_stats(closes)
+
             # 1-year return
-            one_year_return = ((close_prices.iloc[-1] / close_prices.iloc[0]) - 1) * 100
-            
+            one_year_return = (closes[-1] / closes[0] - 1) * 100
+
             # Sharpe ratio (assuming risk-free rate of 2%)
-            risk_free_rate = 0.02
-            excess_returns = returns - (risk_free_rate / 252)
-            sharpe_ratio = (excess_returns.mean() / returns.std()) * np.sqrt(252)
-            
-            # Maximum drawdown
-            rolling_max = close_prices.expanding().max()
-            drawdown = (close_prices / rolling_max) - 1
-            max_drawdown = drawdown.min() * 100
+            sharpe_ratio = ((mean_ret - _RISK_FREE_RATE / 252) / std_ret) * _SQRT252 if std_ret > 0 else 0.0
             
+            # Maximum drawdown: one compiled pass with a scalar running
+            # peak instead of cumulative-max and drawdown intermediates
+            mdd = max_drawdown(closes)
+
             return {
-                '1y_return': one_year_return,
-                'sharpe_ratio': sharpe_ratio,
-                'max_drawdown': max_drawdown
+                '1y_return': float(one_year_return),
+                'sharpe_ratio': float(sharpe_ratio),
+                'max_drawdown': float(mdd)
             }
         except Exception as e:
             print(f"Error calculating fund performance: {e}")
@@ -176,23 +372,47 @@ class DataFetcher:
     def get_market_overview(self):
         """Get market overview data"""
         try:
-            # Fetch major indices
             indices = ['^GSPC', '^DJI', '^IXIC']  # S&P 500, Dow Jones, NASDAQ
+
+            if hasattr(yf, 'download'):
+                # One batched download covers all three indices instead of
+                # separate per-ticker history calls
+                raw = yf.download(" ".join(indices), period="5d", group_by='ticker',
+                                  threads=True, progress=False)
+
+                def extract(index):
+                    try:
+                        frame = raw[index].dropna()
+                        return frame if len(frame) > 0 else None
+                    except (KeyError, TypeError):
+                        return None
+
+                frames = [extract(index) for index in indices]
+            else:
+                # yfinance_cache has no batch download; overlap the
+                # per-ticker history calls instead
+                def fetch(index):
+                    try:
+                        return get_ticker(index).history(period="5d")
+                    except Exception:
+                        return None
+
+                with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+                    frames = list(executor.map(fetch, indices))
+
             market_data = {}
-            
-            for index in indices:
-                ticker = yf.Ticker(index)
-                data = ticker.history(period="5d")
-                if not data.empty:
-                    current_price = data['Close'].iloc[-1]
-                    prev_close = data['Close'].iloc[-2]
+            for index, data in zip(indices, frames):
+                if data is not None and len(data) > 1:
+                    closes = data['Close'].to_numpy()
+                    current_price = float(closes[-1])
+                    prev_close = float(closes[-2])
                     change_pct = ((current_price - prev_close) / prev_close) * 100
-                    
+
                     market_data[index] = {
                         'current_price': current_price,
                         'change_pct': change_pct
                     }
-            
+
             return market_data
         except Exception as e:
             print(f"Error fetching market overview: {e}")
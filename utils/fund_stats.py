@@ -0,0 +1,83 @@
+import numpy as np
+from utils._njit import njit
+
+# Explicit signatures make Numba compile the kernels at import time and
+# cache the compiled code on disk, so the first analysis of a session does
+# not pay the JIT cost.
+@njit("UniTuple(float64, 5)(float64[:])", cache=True)
+def fund_stats(closes):
+    """Compute all daily-return risk statistics in a single pass.
+
+    Walks the close series once, accumulating the running sums needed for
+    mean/std/downside-std, and returns the tuple (annual_return, annual_vol,
+    downside_deviation, sharpe_ratio, sortino_ratio), all in percent except
+    the ratios. Assumes a 2% risk-free rate, matching the page's metrics.
+    """
+    n = len(closes) - 1
+    if n < 2:
+        return (0.0, 0.0, 0.0, 0.0, 0.0)
+
+    total = 0.0
+    total_sq = 0.0
+    down_total = 0.0
+    down_total_sq = 0.0
+    down_count = 0
+    for i in range(1, len(closes)):
+        r = closes[i] / closes[i - 1] - 1.0
+        total += r
+        total_sq += r * r
+        if r < 0:
+            down_total += r
+            down_total_sq += r * r
+            down_count += 1
+
+    mean = total / n
+    variance = (total_sq - total * total / n) / (n - 1)
+    std = np.sqrt(variance) if variance > 0 else 0.0
+
+    annual_return = mean * 252 * 100
+    annual_vol = std * np.sqrt(252) * 100
+
+    downside_deviation = 0.0
+    if down_count > 1:
+        down_var = (down_total_sq - down_total * down_total / down_count) / (down_count - 1)
+        if down_var > 0:
+            downside_deviation = np.sqrt(down_var) * np.sqrt(252) * 100
+
+    risk_free_rate = 2.0
+    sharpe_ratio = (annual_return - risk_free_rate) / annual_vol if annual_vol > 0 else 0.0
+    sortino_ratio = (annual_return - risk_free_rate) / downside_deviation if downside_deviation > 0 else 0.0
+
+    return (annual_return, annual_vol, downside_deviation, sharpe_ratio, sortino_ratio)
+
+@njit("float64[:, :](float64[:], int64[:])", cache=True)
+def rolling_return_stats(closes, periods):
+    """Compute mean/best/worst trailing return for each period in one sweep.
+
+    Returns an (n_periods, 3) array of (mean, max, min) percentages, with
+    NaN rows for periods longer than the available history.
+    """
+    out = np.empty((len(periods), 3))
+    for j in range(len(periods)):
+        p = periods[j]
+        total = 0.0
+        best = -np.inf
+        worst = np.inf
+        count = 0
+        for i in range(p, len(closes)):
+            r = (closes[i] / closes[i - p] - 1.0) * 100.0
+            total += r
+            if r > best:
+                best = r
+            if r < worst:
+                worst = r
+            count += 1
+        if count > 0:
+            out[j, 0] = total / count
+            out[j, 1] = best
+            out[j, 2] = worst
+        else:
+            out[j, 0] = np.nan
+            out[j, 1] = np.nan
+            out[j, 2] = np.nan
+    return out